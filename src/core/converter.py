@@ -9,7 +9,7 @@ import pandas as pd
 import pdfplumber
 from docx import Document
 
-from .config import settings
+from .config import Settings, settings
 from .logging import get_logger
 
 logger = get_logger(__name__)
@@ -25,11 +25,12 @@ class FileConverter:
         self.converted_dir.mkdir(parents=True, exist_ok=True)
 
     @classmethod
-    def from_settings(cls, email: str) -> "FileConverter":
+    def from_settings(cls, email: str, app_settings: Optional[Settings] = None) -> "FileConverter":
         """Create FileConverter using paths from settings for a specific user."""
+        app_settings = app_settings or settings
         return cls(
-            settings.get_user_raw_uploads_path(email),
-            settings.get_user_processed_text_path(email),
+            app_settings.get_user_raw_uploads_path(email),
+            app_settings.get_user_processed_text_path(email),
         )
 
     def detect_file_type(self, file_path: Path) -> str:
@@ -7,7 +7,7 @@ They represent the core business objects in our domain.
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .value_objects import ChunkId, DocumentId, LibraryId, Vector
 
@@ -90,23 +90,34 @@ class Document:
 
     def add_chunk(self, chunk: Chunk) -> None:
         """Add a chunk to this document."""
-        if chunk.document_id != self.id:
-            raise ValueError(f"Chunk document_id ({chunk.document_id}) does not match " f"document id ({self.id})")
+        self.add_chunks((chunk,))
 
-        # Check if chunk belongs to this document by checking if filename starts with document ID
+    def add_chunks(self, chunks: Iterable[Chunk]) -> None:
+        """Add several chunks to this document, re-sorting once at the end."""
         document_id_str = str(self.id)
-        if not chunk.filename.startswith(document_id_str):
-            # Skip chunks that don't belong to this document (handles corrupted embeddings files)
-            return
-
         existing_sequences = {c.sequence_index for c in self.chunks}
-        if chunk.sequence_index in existing_sequences:
-            # Skip duplicate chunks instead of failing (handles corrupted embeddings files)
-            return
+        accepted: List[Chunk] = []
+
+        for chunk in chunks:
+            if chunk.document_id != self.id:
+                raise ValueError(f"Chunk document_id ({chunk.document_id}) does not match " f"document id ({self.id})")
+
+            # Check if chunk belongs to this document by checking if filename starts with document ID
+            if not chunk.filename.startswith(document_id_str):
+                # Skip chunks that don't belong to this document (handles corrupted embeddings files)
+                continue
+
+            if chunk.sequence_index in existing_sequences:
+                # Skip duplicate chunks instead of failing (handles corrupted embeddings files)
+                continue
+
+            existing_sequences.add(chunk.sequence_index)
+            accepted.append(chunk)
 
-        self.chunks.append(chunk)
-        # Keep chunks sorted by sequence index
-        self.chunks.sort(key=lambda c: c.sequence_index)
+        if accepted:
+            self.chunks.extend(accepted)
+            # Keep chunks sorted by sequence index
+            self.chunks.sort(key=lambda c: c.sequence_index)
 
     def get_chunk_count(self) -> int:
         """Get the total number of chunks."""
@@ -1,39 +1,57 @@
 """Pipeline orchestrator for file processing workflows."""
 
 import asyncio
+import inspect
+import sys
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
-from enum import Enum
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Type
+from typing import Any, Awaitable, Dict, FrozenSet, List, Optional, Sequence, Set, Type, Union
 
 from .logging import get_logger
 
 logger = get_logger(__name__)
 
 
-class StepStatus(Enum):
-    """Status of a pipeline step."""
+class StepStatus(IntEnum):
+    """Status of a pipeline step.
 
-    PENDING = "pending"
-    RUNNING = "running"
-    SUCCESS = "success"
-    FAILED = "failed"
-    SKIPPED = "skipped"
+    Integer-valued for cheap comparisons; use ``label`` for the serialized form.
+    """
 
+    PENDING = 0
+    RUNNING = 1
+    SUCCESS = 2
+    FAILED = 3
+    SKIPPED = 4
 
-class PipelineStatus(Enum):
-    """Status of the entire pipeline."""
+    @property
+    def label(self) -> str:
+        """Lowercase name used in pipeline summaries."""
+        return self.name.lower()
 
-    PENDING = "pending"
-    RUNNING = "running"
-    SUCCESS = "success"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
 
+class PipelineStatus(IntEnum):
+    """Status of the entire pipeline.
 
-@dataclass
+    Integer-valued for cheap comparisons; use ``label`` for the serialized form.
+    """
+
+    PENDING = 0
+    RUNNING = 1
+    SUCCESS = 2
+    FAILED = 3
+    CANCELLED = 4
+
+    @property
+    def label(self) -> str:
+        """Lowercase name used in pipeline summaries."""
+        return self.name.lower()
+
+
+@dataclass(slots=True, frozen=True)
 class StepResult:
     """Result of executing a pipeline step."""
 
@@ -44,7 +62,7 @@ class StepResult:
     execution_time: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineContext:
     """Context passed between pipeline steps."""
 
@@ -59,14 +77,23 @@ class PipelineContext:
 class PipelineStep(ABC):
     """Abstract base class for pipeline steps."""
 
+    # Keys this step reads from / writes to ``context.metadata``. Steps declaring
+    # neither are treated as depending on every step that comes before them.
+    requires: FrozenSet[str] = frozenset()
+    provides: FrozenSet[str] = frozenset()
+
     def __init__(self, name: str, description: str = "", retry_count: int = 0):
-        self.name = name
+        # Interned so step_results keys hash and compare by identity
+        self.name = sys.intern(name)
         self.description = description
         self.retry_count = retry_count
 
     @abstractmethod
-    async def execute(self, context: PipelineContext) -> StepResult:
-        """Execute the pipeline step."""
+    def execute(self, context: PipelineContext) -> Union[StepResult, Awaitable[StepResult]]:
+        """Execute the pipeline step.
+
+        Steps doing I/O implement this as a coroutine; trivial steps may return the result directly.
+        """
         pass
 
     def should_skip(self, context: PipelineContext) -> bool:
@@ -79,7 +106,7 @@ class PipelineStep(ABC):
 
 
 class Pipeline:
-    """Pipeline orchestrator that executes steps in sequence."""
+    """Pipeline orchestrator that executes steps in dependency order."""
 
     def __init__(self, name: str, steps: Sequence[PipelineStep]):
         self.name = name
@@ -87,41 +114,42 @@ class Pipeline:
         self.status = PipelineStatus.PENDING
         self.start_time: Optional[datetime] = None
         self.end_time: Optional[datetime] = None
+        # Index of the first step in the wave currently running; steps of a wave run concurrently
         self.current_step_index = 0
 
     async def execute(self, context: PipelineContext) -> Dict[str, Any]:
-        """Execute the pipeline with the given context."""
+        """Execute the pipeline with the given context.
+
+        Steps are run wave by wave; steps within a wave are independent and run concurrently.
+        """
         self.status = PipelineStatus.RUNNING
         self.start_time = datetime.now()
 
         logger.info(f"Starting pipeline '{self.name}' for {context.email}: {context.file_id}")
 
         try:
-            for i, step in enumerate(self.steps):
-                self.current_step_index = i
-
-                if step.should_skip(context):
-                    result = StepResult(
-                        status=StepStatus.SKIPPED,
-                        message=f"Step '{step.name}' was skipped",
-                    )
-                    context.step_results[step.name] = result
-                    logger.info(f"Skipped step '{step.name}' for {context.file_id}")
-                    continue
-
-                # Execute step with retry logic
-                result = await self._execute_step_with_retry(step, context)
-                context.step_results[step.name] = result
-
-                if result.status == StepStatus.FAILED:
-                    self.status = PipelineStatus.FAILED
-                    logger.error(
-                        f"Pipeline '{self.name}' failed at step '{step.name}' " f"for {context.file_id}: {result.error}"
-                    )
+            step_results = context.step_results
+            step_index = 0
+            for wave in self._build_waves():
+                self.current_step_index = step_index
+                step_index += len(wave)
+
+                results = await asyncio.gather(*(self._run_step(step, context) for step in wave))
+
+                # Record results in declaration order so the summary stays deterministic
+                for step, result in zip(wave, results):
+                    step_results[step.name] = result
+
+                    if result.status == StepStatus.FAILED:
+                        self.status = PipelineStatus.FAILED
+                        logger.error(
+                            f"Pipeline '{self.name}' failed at step '{step.name}' "
+                            f"for {context.file_id}: {result.error}"
+                        )
+
+                if self.status == PipelineStatus.FAILED:
                     break
 
-                logger.info(f"Completed step '{step.name}' for {context.file_id}: {result.message}")
-
             if self.status != PipelineStatus.FAILED:
                 self.status = PipelineStatus.SUCCESS
                 logger.info(f"Pipeline '{self.name}' completed successfully for {context.file_id}")
@@ -136,6 +164,59 @@ class Pipeline:
 
         return self._get_pipeline_summary(context)
 
+    def _build_waves(self) -> List[List[PipelineStep]]:
+        """Group consecutive steps into waves that can be executed concurrently.
+
+        A step joins the current wave only if it and every step already in the wave
+        declare their dependencies, it neither requires nor provides a key that the
+        wave provides, and it does not provide a key that the wave requires. Otherwise it
+        starts a new wave, preserving declaration order.
+        """
+        waves: List[List[PipelineStep]] = []
+        wave_provides: Set[str] = set()
+        wave_requires: Set[str] = set()
+
+        for step in self.steps:
+            current = waves[-1] if waves else None
+            if (
+                current is not None
+                and self._declares_dependencies(step)
+                and all(self._declares_dependencies(s) for s in current)
+                and not (step.requires | step.provides) & wave_provides
+                and not step.provides & wave_requires
+            ):
+                current.append(step)
+                wave_provides |= step.provides
+                wave_requires |= step.requires
+            else:
+                waves.append([step])
+                wave_provides = set(step.provides)
+                wave_requires = set(step.requires)
+
+        return waves
+
+    @staticmethod
+    def _declares_dependencies(step: PipelineStep) -> bool:
+        """Check whether a step declares the metadata keys it requires or provides."""
+        return bool(step.requires or step.provides)
+
+    async def _run_step(self, step: PipelineStep, context: PipelineContext) -> StepResult:
+        """Run a single step, honouring its skip condition."""
+        if step.should_skip(context):
+            logger.info(f"Skipped step '{step.name}' for {context.file_id}")
+            return StepResult(
+                status=StepStatus.SKIPPED,
+                message=f"Step '{step.name}' was skipped",
+            )
+
+        # Execute step with retry logic
+        result = await self._execute_step_with_retry(step, context)
+
+        if result.status != StepStatus.FAILED:
+            logger.info(f"Completed step '{step.name}' for {context.file_id}: {result.message}")
+
+        return result
+
     async def _execute_step_with_retry(self, step: PipelineStep, context: PipelineContext) -> StepResult:
         """Execute a step with retry logic."""
         attempt = 0
@@ -149,9 +230,11 @@ class Pipeline:
                     f"(attempt {attempt + 1}/{step.retry_count + 1})"
                 )
 
-                result = await step.execute(context)
+                outcome = step.execute(context)
+                # Only await real coroutines; synchronous steps skip the coroutine machinery
+                result = await outcome if inspect.isawaitable(outcome) else outcome
                 execution_time = (datetime.now() - start_time).total_seconds()
-                result.execution_time = execution_time
+                result = replace(result, execution_time=execution_time)
 
                 if result.status == StepStatus.SUCCESS:
                     return result
@@ -194,7 +277,7 @@ class Pipeline:
 
         return {
             "pipeline_name": self.name,
-            "status": self.status.value,
+            "status": self.status.label,
             "file_id": context.file_id,
             "email": context.email,
             "start_time": self.start_time.isoformat() if self.start_time else None,
@@ -204,7 +287,7 @@ class Pipeline:
             "steps_failed": len([r for r in context.step_results.values() if r.status == StepStatus.FAILED]),
             "step_results": {
                 name: {
-                    "status": result.status.value,
+                    "status": result.status.label,
                     "message": result.message,
                     "execution_time": result.execution_time,
                     "error": result.error,
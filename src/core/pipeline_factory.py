@@ -1,10 +1,21 @@
 """Factory for creating different pipeline configurations."""
 
-from typing import Dict, List, Type
+from typing import Dict, List, Tuple, Type
 
 from .pipeline import Pipeline, PipelineStep
 from .pipeline_steps import EmbeddingGenerationStep, FileConversionStep, TextChunkingStep, VectorStorageStep
 
+# Step classes available to custom pipelines, keyed by class name
+_STEP_CLASSES: Dict[str, Type[PipelineStep]] = {
+    "FileConversionStep": FileConversionStep,
+    "TextChunkingStep": TextChunkingStep,
+    "EmbeddingGenerationStep": EmbeddingGenerationStep,
+    "VectorStorageStep": VectorStorageStep,
+}
+
+_AVAILABLE_PIPELINES: Tuple[str, ...] = ("full_processing", "text_only", "embedding_only", "custom")
+_AVAILABLE_STEPS: Tuple[str, ...] = tuple(_STEP_CLASSES)
+
 
 class PipelineFactory:
     """Factory for creating pre-configured pipelines."""
@@ -73,36 +84,23 @@ class PipelineFactory:
         Raises:
             ValueError: If any step name is not recognized
         """
-        step_mapping: Dict[str, Type[PipelineStep]] = {
-            "FileConversionStep": FileConversionStep,
-            "TextChunkingStep": TextChunkingStep,
-            "EmbeddingGenerationStep": EmbeddingGenerationStep,
-            "VectorStorageStep": VectorStorageStep,
-        }
-
         steps: List[PipelineStep] = []
         for step_name in step_names:
-            if step_name not in step_mapping:
-                available_steps = list(step_mapping.keys())
-                raise ValueError(f"Unknown step '{step_name}'. Available steps: {available_steps}")
+            step_class = _STEP_CLASSES.get(step_name)
+            if step_class is None:
+                raise ValueError(f"Unknown step '{step_name}'. Available steps: {list(_AVAILABLE_STEPS)}")
 
-            step_class = step_mapping[step_name]
             # mypy can't infer that these are concrete classes, not abstract
             steps.append(step_class())  # type: ignore[call-arg]
 
         return Pipeline(name="custom_pipeline", steps=steps)
 
     @staticmethod
-    def list_available_pipelines() -> List[str]:
+    def list_available_pipelines() -> Tuple[str, ...]:
         """List all available pre-configured pipelines."""
-        return ["full_processing", "text_only", "embedding_only", "custom"]
+        return _AVAILABLE_PIPELINES
 
     @staticmethod
-    def list_available_steps() -> List[str]:
+    def list_available_steps() -> Tuple[str, ...]:
         """List all available pipeline steps."""
-        return [
-            "FileConversionStep",
-            "TextChunkingStep",
-            "EmbeddingGenerationStep",
-            "VectorStorageStep",
-        ]
+        return _AVAILABLE_STEPS
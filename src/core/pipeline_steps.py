@@ -1,12 +1,15 @@
 """Concrete pipeline steps for file processing workflows."""
 
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Optional
 
 import cohere
 import tiktoken
 
-from .config import settings
+from .config import Settings
+from .config import settings as default_settings
 from .converter import FileConverter
 from .logging import get_logger
 from .pipeline import PipelineContext, PipelineStep, StepResult, StepStatus, pipeline_registry
@@ -15,20 +18,29 @@ from .storage import StorageFactory
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _get_encoding(name: str) -> Any:
+    """Load a tiktoken encoding once per process."""
+    return tiktoken.get_encoding(name)
+
+
 class FileConversionStep(PipelineStep):
     """Convert uploaded file to text format."""
 
-    def __init__(self) -> None:
+    provides = frozenset({"converted_text_path"})
+
+    def __init__(self, settings: Optional[Settings] = None) -> None:
         super().__init__(
             name="file_conversion",
             description="Convert uploaded file to text format",
             retry_count=2,
         )
+        self.settings = settings or default_settings
 
     async def execute(self, context: PipelineContext) -> StepResult:
         """Convert file to text."""
         try:
-            converter = FileConverter.from_settings(context.email)
+            converter = FileConverter.from_settings(context.email, self.settings)
             success, converted_path = converter.process_file(context.file_path, context.original_filename)
 
             if success and converted_path:
@@ -56,12 +68,16 @@ class FileConversionStep(PipelineStep):
 class TextChunkingStep(PipelineStep):
     """Chunk text into smaller pieces for embedding."""
 
-    def __init__(self) -> None:
+    requires = frozenset({"converted_text_path"})
+    provides = frozenset({"chunks_dir", "chunk_count"})
+
+    def __init__(self, settings: Optional[Settings] = None) -> None:
         super().__init__(
             name="text_chunking",
             description="Split text into chunks for embedding generation",
             retry_count=1,
         )
+        self.settings = settings or default_settings
 
     def should_skip(self, context: PipelineContext) -> bool:
         """Skip if no converted text path available."""
@@ -82,23 +98,19 @@ class TextChunkingStep(PipelineStep):
             with open(text_file_path, "r", encoding="utf-8") as f:
                 text_content = f.read()
 
-            encoding = tiktoken.get_encoding(settings.tiktoken_encoding)
+            encoding = _get_encoding(self.settings.tiktoken_encoding)
             chunks = self._create_text_chunks(text_content, encoding)
 
-            chunks_dir = settings.get_user_raw_chunks_path(context.email)
+            chunks_dir = self.settings.get_user_raw_chunks_path(context.email)
             chunks_dir.mkdir(parents=True, exist_ok=True)
 
             base_filename = context.file_id
             chunk_files = []
 
             for i, chunk in enumerate(chunks):
-                chunk_filename = f"{base_filename}_chunk_{i:03d}.txt"
-                chunk_path = chunks_dir / chunk_filename
-
-                with open(chunk_path, "w", encoding="utf-8") as f:
-                    f.write(chunk)
-
-                chunk_files.append(str(chunk_path))
+                chunk_path = str(chunks_dir / f"{base_filename}_chunk_{i:03d}.txt")
+                self._write_chunk(chunk_path, chunk.encode("utf-8"))
+                chunk_files.append(chunk_path)
 
             context.metadata["chunks_dir"] = str(chunks_dir)
             context.metadata["chunk_count"] = len(chunks)
@@ -116,11 +128,22 @@ class TextChunkingStep(PipelineStep):
         except Exception as e:
             return StepResult(status=StepStatus.FAILED, message="Text chunking failed", error=str(e))
 
+    @staticmethod
+    def _write_chunk(path: str, data: bytes) -> None:
+        """Write a chunk file with raw fd calls, bypassing Python's buffered text layer."""
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+
     def _create_text_chunks(self, text: str, encoding: Any) -> List[str]:
         """Create overlapping text chunks using tiktoken encoding."""
         tokens = encoding.encode(text)
-        chunk_size = settings.chunk_size
-        overlap_size = int(chunk_size * settings.chunk_overlap_percent)
+        chunk_size = self.settings.chunk_size
+        overlap_size = int(chunk_size * self.settings.chunk_overlap_percent)
 
         chunks = []
         start = 0
@@ -142,12 +165,16 @@ class TextChunkingStep(PipelineStep):
 class EmbeddingGenerationStep(PipelineStep):
     """Generate embeddings for text chunks using Cohere API."""
 
-    def __init__(self) -> None:
+    requires = frozenset({"chunks_dir"})
+    provides = frozenset({"embeddings_data", "embedding_count"})
+
+    def __init__(self, settings: Optional[Settings] = None) -> None:
         super().__init__(
             name="embedding_generation",
             description="Generate embeddings using Cohere API",
             retry_count=3,  # API calls can be flaky
         )
+        self.settings = settings or default_settings
 
     def should_skip(self, context: PipelineContext) -> bool:
         """Skip if no chunks directory available."""
@@ -187,6 +214,7 @@ class EmbeddingGenerationStep(PipelineStep):
                     error=f"No files matching pattern {chunk_pattern} in {chunks_dir}",
                 )
 
+            encoding = _get_encoding(self.settings.tiktoken_encoding)
             chunks_data = []
             for chunk_file in sorted(chunk_files):
                 with open(chunk_file, "r", encoding="utf-8") as f:
@@ -196,23 +224,23 @@ class EmbeddingGenerationStep(PipelineStep):
                     {
                         "filename": chunk_file.name,
                         "text": chunk_text,
-                        "token_count": len(tiktoken.get_encoding(settings.tiktoken_encoding).encode(chunk_text)),
+                        "token_count": len(encoding.encode(chunk_text)),
                     }
                 )
 
-            if not settings.cohere_api_key:
+            if not self.settings.cohere_api_key:
                 return StepResult(
                     status=StepStatus.FAILED,
                     message="Cohere API key not configured",
                     error="COHERE_API_KEY environment variable not set",
                 )
 
-            cohere_client = cohere.Client(settings.cohere_api_key)
+            cohere_client = cohere.Client(self.settings.cohere_api_key)
             texts = [str(chunk["text"]) for chunk in chunks_data]
 
             response = cohere_client.embed(
                 texts=texts,
-                model=settings.cohere_model,
+                model=self.settings.cohere_model,
                 input_type="search_document",
             )
 
@@ -233,7 +261,7 @@ class EmbeddingGenerationStep(PipelineStep):
                         "text": chunk["text"],
                         "token_count": chunk["token_count"],
                         "embedding": response_embeddings[i],
-                        "embedding_model": settings.cohere_model,
+                        "embedding_model": self.settings.cohere_model,
                     }
                 )
 
@@ -242,10 +270,10 @@ class EmbeddingGenerationStep(PipelineStep):
 
             return StepResult(
                 status=StepStatus.SUCCESS,
-                message=f"Generated {len(embeddings_data)} embeddings using {settings.cohere_model}",
+                message=f"Generated {len(embeddings_data)} embeddings using {self.settings.cohere_model}",
                 data={
                     "embedding_count": len(embeddings_data),
-                    "model": settings.cohere_model,
+                    "model": self.settings.cohere_model,
                 },
             )
 
@@ -260,12 +288,16 @@ class EmbeddingGenerationStep(PipelineStep):
 class VectorStorageStep(PipelineStep):
     """Store embeddings in the configured vector storage."""
 
-    def __init__(self) -> None:
+    requires = frozenset({"embeddings_data"})
+    provides = frozenset({"storage_path"})
+
+    def __init__(self, settings: Optional[Settings] = None) -> None:
         super().__init__(
             name="vector_storage",
             description="Store embeddings in vector database",
             retry_count=2,
         )
+        self.settings = settings or default_settings
 
     def should_skip(self, context: PipelineContext) -> bool:
         """Skip if no embeddings data available."""
@@ -276,17 +308,19 @@ class VectorStorageStep(PipelineStep):
         try:
             embeddings_data = context.metadata["embeddings_data"]
 
-            vectors_dir = settings.get_user_processed_vectors_path(context.email)
-            storage = StorageFactory.create_storage(storage_type=settings.vector_storage_type, storage_path=vectors_dir)
+            vectors_dir = self.settings.get_user_processed_vectors_path(context.email)
+            storage = StorageFactory.create_storage(
+                storage_type=self.settings.vector_storage_type, storage_path=vectors_dir
+            )
 
             file_metadata = {
                 "email": context.email,
                 "file_id": context.file_id,
                 "original_filename": context.original_filename,
-                "embedding_model": settings.cohere_model,
-                "chunk_size": settings.chunk_size,
-                "chunk_overlap_percent": settings.chunk_overlap_percent,
-                "storage_type": settings.vector_storage_type,
+                "embedding_model": self.settings.cohere_model,
+                "chunk_size": self.settings.chunk_size,
+                "chunk_overlap_percent": self.settings.chunk_overlap_percent,
+                "storage_type": self.settings.vector_storage_type,
                 "pipeline_execution": True,
             }
 
@@ -303,7 +337,7 @@ class VectorStorageStep(PipelineStep):
                 message=f"Embeddings stored successfully at {saved_path}",
                 data={
                     "storage_path": str(saved_path),
-                    "storage_type": settings.vector_storage_type,
+                    "storage_type": self.settings.vector_storage_type,
                     "embedding_count": len(embeddings_data),
                 },
             )
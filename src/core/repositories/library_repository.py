@@ -124,8 +124,7 @@ class LibraryRepository(ILibraryRepository):
             )
 
             chunks = await self._load_document_chunks(document_id, vector_file)
-            for chunk in chunks:
-                document.add_chunk(chunk)
+            document.add_chunks(chunks)
 
             return document
 
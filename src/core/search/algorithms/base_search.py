@@ -2,9 +2,12 @@
 Base class for search algorithms.
 """
 
+import heapq
 from abc import ABC
 from typing import List
 
+import numpy as np
+
 from ...domain import Chunk, Vector
 from ..interfaces import ISearchAlgorithm
 from ..query import ChunkSearchResult
@@ -53,20 +56,66 @@ class BaseSearchAlgorithm(ISearchAlgorithm, ABC):
         if len(chunks) != len(scores):
             raise ValueError("Chunks and scores lists must have the same length")
 
-        # Combine chunks with their scores
-        chunk_score_pairs = list(zip(chunks, scores))
-
-        # Sort by score in descending order (highest similarity first)
-        chunk_score_pairs.sort(key=lambda x: x[1], reverse=True)
+        # Keep the top `limit` chunks by score, highest first (ties keep their input order)
+        chunk_score_pairs = heapq.nlargest(limit, zip(chunks, scores), key=lambda x: x[1])
 
         # Create search results with ranks
         results = []
-        for rank, (chunk, score) in enumerate(chunk_score_pairs[:limit], start=1):
+        for rank, (chunk, score) in enumerate(chunk_score_pairs, start=1):
             result = ChunkSearchResult(chunk=chunk, similarity_score=score, rank=rank)
             results.append(result)
 
         return results
 
+    def _cosine_scores(self, query_vector: Vector, chunks: List[Chunk]) -> np.ndarray:
+        """
+        Cosine similarity between the query and every chunk embedding.
+
+        All embeddings are stacked into one matrix so the dot products are a single
+        matrix-vector product. Zero-norm vectors score 0.0, as in Vector.cosine_similarity.
+
+        Args:
+            query_vector: The vector representation of the search query
+            chunks: Chunks with embeddings of the query's dimension
+
+        Returns:
+            Array of similarity scores (same order as chunks)
+        """
+        rows = []
+        for chunk in chunks:
+            assert chunk.embedding is not None  # Already validated in _filter_valid_chunks
+            rows.append(chunk.embedding.values)
+
+        matrix = np.array(rows, dtype=np.float64)
+        query = np.asarray(query_vector.values, dtype=np.float64)
+
+        denominators = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+        scores = np.zeros(len(rows))
+        np.divide(matrix @ query, denominators, out=scores, where=denominators != 0)
+        return scores
+
+    def _rank_results(self, chunks: List[Chunk], scores: np.ndarray, limit: int) -> List[ChunkSearchResult]:
+        """
+        Create ranked search results from an array of scores.
+
+        Equivalent to _create_search_results: equal scores keep their input order.
+        Only chunks scoring at least the limit-th best score are sorted.
+        """
+        if len(chunks) != len(scores):
+            raise ValueError("Chunks and scores lists must have the same length")
+
+        candidates = np.arange(len(scores))
+        if limit < len(scores):
+            # Everything tied with the limit-th best score stays a candidate, so ties break as in a full sort
+            threshold = np.partition(scores, len(scores) - limit)[len(scores) - limit]
+            candidates = np.flatnonzero(scores >= threshold)
+
+        order = candidates[np.argsort(-scores[candidates], kind="stable")][:limit]
+        return [
+            ChunkSearchResult(chunk=chunks[index], similarity_score=float(scores[index]), rank=rank)
+            for rank, index in enumerate(order, start=1)
+        ]
+
     def _filter_valid_chunks(self, chunks: List[Chunk]) -> List[Chunk]:
         """Filter chunks to only include those with embeddings."""
         return [chunk for chunk in chunks if chunk.has_embedding()]
@@ -37,15 +37,11 @@ class CosineSearchAlgorithm(BaseSearchAlgorithm):
         # Filter to only chunks with embeddings (should be all of them after validation)
         valid_chunks = self._filter_valid_chunks(chunks)
 
-        # Calculate cosine similarity for each chunk
-        similarities = []
-        for chunk in valid_chunks:
-            assert chunk.embedding is not None  # Already validated in _filter_valid_chunks
-            similarity = chunk.embedding.cosine_similarity(query_vector)
-            similarities.append(similarity)
+        # Calculate cosine similarity for all chunks at once
+        similarities = self._cosine_scores(query_vector, valid_chunks)
 
         # Create and return ranked results
-        return self._create_search_results(valid_chunks, similarities, limit)
+        return self._rank_results(valid_chunks, similarities, limit)
 
     def get_algorithm_name(self) -> str:
         """Get the name of this search algorithm."""
@@ -4,13 +4,64 @@ Hybrid search algorithm combining cosine similarity with keyword matching.
 
 import re
 from collections import Counter
-from math import log
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+import numpy as np
 
 from ...domain import Chunk, Vector
 from ..query import ChunkSearchResult
 from .base_search import BaseSearchAlgorithm
 
+# Common English stop words ignored by keyword matching
+_STOP_WORDS = frozenset(
+    {
+        "the",
+        "a",
+        "an",
+        "and",
+        "or",
+        "but",
+        "in",
+        "on",
+        "at",
+        "to",
+        "for",
+        "of",
+        "with",
+        "by",
+        "is",
+        "are",
+        "was",
+        "were",
+        "be",
+        "been",
+        "being",
+        "have",
+        "has",
+        "had",
+        "do",
+        "does",
+        "did",
+        "will",
+        "would",
+        "could",
+        "should",
+        "may",
+        "might",
+        "can",
+        "this",
+        "that",
+        "these",
+        "those",
+    }
+)
+
+_WORD_RE = re.compile(r"\w+")
+
+# Distinct chunk texts whose keyword counts are kept between searches
+_KEYWORD_CACHE_SIZE = 4096
+
 
 class HybridSearchAlgorithm(BaseSearchAlgorithm):
     """
@@ -23,13 +74,17 @@ class HybridSearchAlgorithm(BaseSearchAlgorithm):
     This provides both semantic understanding and exact keyword matching.
     """
 
-    def __init__(self, cosine_weight: float = 0.7, keyword_weight: float = 0.3):
+    def __init__(
+        self, cosine_weight: float = 0.7, keyword_weight: float = 0.3, candidate_multiplier: Optional[int] = None
+    ):
         """
         Initialize hybrid search algorithm.
 
         Args:
             cosine_weight: Weight for cosine similarity component (0.0 to 1.0)
             keyword_weight: Weight for keyword matching component (0.0 to 1.0)
+            candidate_multiplier: If set, only the top ``limit * candidate_multiplier`` chunks by
+                cosine similarity are keyword-scored and ranked; None scores every chunk
         """
         if cosine_weight < 0 or cosine_weight > 1:
             raise ValueError("Cosine weight must be between 0.0 and 1.0")
@@ -40,8 +95,17 @@ class HybridSearchAlgorithm(BaseSearchAlgorithm):
         if abs(cosine_weight + keyword_weight - 1.0) > 1e-6:
             raise ValueError("Cosine weight and keyword weight must sum to 1.0")
 
+        if candidate_multiplier is not None and candidate_multiplier < 1:
+            raise ValueError("Candidate multiplier must be at least 1")
+
         self.cosine_weight = cosine_weight
         self.keyword_weight = keyword_weight
+        self.candidate_multiplier = candidate_multiplier
+
+        # Libraries are reloaded for every query, so cache by chunk text rather than chunk identity
+        self._keyword_counts: Callable[[str], Counter[str]] = lru_cache(maxsize=_KEYWORD_CACHE_SIZE)(
+            self._count_keywords
+        )
 
     def search(
         self, query_vector: Vector, chunks: List[Chunk], limit: int, query_text: Optional[str] = None
@@ -64,90 +128,86 @@ class HybridSearchAlgorithm(BaseSearchAlgorithm):
 
         valid_chunks = self._filter_valid_chunks(chunks)
 
-        cosine_scores = []
-        for chunk in valid_chunks:
-            assert chunk.embedding is not None  # Already validated in _filter_valid_chunks
-            similarity = chunk.embedding.cosine_similarity(query_vector)
-            cosine_scores.append(similarity)
+        cosine_scores = self._cosine_scores(query_vector, valid_chunks)
+
+        if self.candidate_multiplier is not None:
+            # Late fusion: keyword-score only the best cosine candidates
+            # (keyword statistics are then relative to the candidate set)
+            candidate_count = limit * self.candidate_multiplier
+            if candidate_count < len(valid_chunks):
+                candidates = np.sort(np.argpartition(-cosine_scores, candidate_count - 1)[:candidate_count])
+                valid_chunks = [valid_chunks[index] for index in candidates]
+                cosine_scores = cosine_scores[candidates]
 
         keyword_scores = self._calculate_keyword_scores(query_text, valid_chunks)
 
-        hybrid_scores = []
-        for cosine_score, keyword_score in zip(cosine_scores, keyword_scores):
-            hybrid_score = (self.cosine_weight * cosine_score) + (self.keyword_weight * keyword_score)
-            hybrid_scores.append(hybrid_score)
+        hybrid_scores = (self.cosine_weight * cosine_scores) + (self.keyword_weight * keyword_scores)
 
-        return self._create_search_results(valid_chunks, hybrid_scores, limit)
+        return self._rank_results(valid_chunks, hybrid_scores, limit)
 
-    def _calculate_keyword_scores(self, query_text: str, chunks: List[Chunk]) -> List[float]:
+    def _calculate_keyword_scores(self, query_text: str, chunks: List[Chunk]) -> np.ndarray:
         """
         Calculate keyword matching scores using BM25-like algorithm.
 
+        Each chunk is tokenized once into a term-frequency table; the scores are then
+        computed over an (chunks x query keywords) matrix in one vectorized pass.
+
         Args:
             query_text: The original query text
             chunks: List of chunks to score
 
         Returns:
-            List of keyword matching scores (0.0 to 1.0)
+            Array of keyword matching scores (0.0 to 1.0), same order as chunks
         """
         if not query_text.strip():
-            return [0.0] * len(chunks)
+            return np.zeros(len(chunks))
 
         query_keywords = self._extract_keywords(query_text)
 
         if not query_keywords:
-            return [0.0] * len(chunks)
+            return np.zeros(len(chunks))
 
-        doc_frequencies = self._calculate_document_frequencies(query_keywords, chunks)
+        # Term frequency of each query keyword in each chunk
+        chunk_keyword_counts = [self._keyword_counts(chunk.text) for chunk in chunks]
+        tf = np.array(
+            [[counts.get(keyword, 0) for keyword in query_keywords] for counts in chunk_keyword_counts],
+            dtype=np.float64,
+        )
 
-        # Calculate BM25-like scores for each chunk
-        scores = []
+        # Document frequency (number of documents containing the term)
         total_docs = len(chunks)
+        df = np.count_nonzero(tf, axis=0)
 
-        for chunk in chunks:
-            chunk_keywords = self._extract_keywords(chunk.text)
-            chunk_keyword_counts = Counter(chunk_keywords)
-
-            score = 0.0
-            for keyword in query_keywords:
-                if keyword in chunk_keyword_counts:
-                    # Term frequency in document
-                    tf = chunk_keyword_counts[keyword]
-
-                    # Document frequency (number of documents containing the term)
-                    df = doc_frequencies.get(keyword, 0)
-
-                    # Inverse document frequency with smoothing for small collections
-                    if df > 0:
-                        idf = log((total_docs - df + 0.5) / (df + 0.5))
-                        # Add minimum IDF for small collections to avoid 0 scores
-                        if idf <= 0 and total_docs <= 10:
-                            idf = 0.1  # Small positive value for relevance
-                    else:
-                        idf = 0
-
-                    # BM25-like scoring (simplified)
-                    k1 = 1.2  # Term frequency saturation parameter
-                    score += idf * (tf * (k1 + 1)) / (tf + k1)
+        # Inverse document frequency with smoothing for small collections
+        idf = np.log((total_docs - df + 0.5) / (df + 0.5))
+        if total_docs <= 10:
+            # Add minimum IDF for small collections to avoid 0 scores
+            idf[idf <= 0] = 0.1  # Small positive value for relevance
+        idf[df == 0] = 0.0
 
-            scores.append(score)
+        # BM25-like scoring (simplified)
+        k1 = 1.2  # Term frequency saturation parameter
+        scores: np.ndarray = ((tf * (k1 + 1)) / (tf + k1)) @ idf
 
         # Normalize scores to 0-1 range
-        if scores:
-            min_score = min(scores)
-            max_score = max(scores)
+        if scores.size:
+            min_score = scores.min()
 
             # Handle negative scores by shifting to positive range
             if min_score < 0:
-                scores = [score - min_score for score in scores]
-                max_score = max_score - min_score
+                scores = scores - min_score
 
             # Normalize to 0-1 range
+            max_score = scores.max()
             if max_score > 0:
-                scores = [score / max_score for score in scores]
+                scores = scores / max_score
 
         return scores
 
+    def _count_keywords(self, text: str) -> Counter[str]:
+        """Count keyword occurrences in text; results are cached and must not be mutated."""
+        return Counter(self._extract_keywords(text))
+
     def _extract_keywords(self, text: str) -> List[str]:
         """
         Extract keywords from text.
@@ -158,78 +218,9 @@ class HybridSearchAlgorithm(BaseSearchAlgorithm):
         Returns:
             List of lowercase keywords
         """
-        # Simple keyword extraction: lowercase, remove punctuation, split on whitespace
-        # Filter out common stop words and short words
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "is",
-            "are",
-            "was",
-            "were",
-            "be",
-            "been",
-            "being",
-            "have",
-            "has",
-            "had",
-            "do",
-            "does",
-            "did",
-            "will",
-            "would",
-            "could",
-            "should",
-            "may",
-            "might",
-            "can",
-            "this",
-            "that",
-            "these",
-            "those",
-        }
-
-        cleaned_text = re.sub(r"[^\w\s]", " ", text.lower())
-
-        words = cleaned_text.split()
-        keywords = [word for word in words if len(word) > 2 and word not in stop_words]
-
-        return keywords
-
-    def _calculate_document_frequencies(self, keywords: List[str], chunks: List[Chunk]) -> Dict[str, int]:
-        """
-        Calculate how many documents contain each keyword.
-
-        Args:
-            keywords: List of keywords to check
-            chunks: List of chunks to analyze
-
-        Returns:
-            Dictionary mapping keyword to document frequency
-        """
-        doc_frequencies = {}
-
-        for keyword in keywords:
-            count = 0
-            for chunk in chunks:
-                chunk_keywords = set(self._extract_keywords(chunk.text))
-                if keyword in chunk_keywords:
-                    count += 1
-            doc_frequencies[keyword] = count
-
-        return doc_frequencies
+        # Simple keyword extraction: lowercase, split into runs of word characters
+        # (punctuation and whitespace separate words), drop stop words and short words
+        return [word for word in _WORD_RE.findall(text.lower()) if len(word) > 2 and word not in _STOP_WORDS]
 
     def get_algorithm_name(self) -> str:
         return "hybrid"
@@ -3,7 +3,7 @@ Main search engine for library-level search operations.
 """
 
 import time
-from typing import Dict, List
+from typing import Callable, Dict, List
 
 from ..domain import Library
 from ..search.algorithms import CosineSearchAlgorithm, HybridSearchAlgorithm
@@ -18,8 +18,9 @@ class LibrarySearchEngine(ILibrarySearchEngine):
     Supports multiple search algorithms and handles the complete search workflow.
     """
 
-    def __init__(self, embedding_service: IEmbeddingService):
+    def __init__(self, embedding_service: IEmbeddingService, clock: Callable[[], float] = time.time):
         self.embedding_service = embedding_service
+        self.clock = clock
 
         self.algorithms: Dict[SearchAlgorithm, ISearchAlgorithm] = {
             SearchAlgorithm.COSINE: CosineSearchAlgorithm(),
@@ -37,7 +38,7 @@ class LibrarySearchEngine(ILibrarySearchEngine):
         Returns:
             SearchResults containing ranked chunks and metadata
         """
-        start_time = time.time()
+        start_time = self.clock()
 
         try:
             if not library.has_documents_with_embeddings():
@@ -64,7 +65,7 @@ class LibrarySearchEngine(ILibrarySearchEngine):
                 limit=query.limit,
                 query_text=query.text,
             )
-            execution_time = time.time() - start_time
+            execution_time = self.clock() - start_time
             return SearchResults(
                 results=search_results,
                 algorithm_used=query.algorithm,
@@ -83,7 +84,7 @@ class LibrarySearchEngine(ILibrarySearchEngine):
         return [algorithm.value for algorithm in self.algorithms.keys()]
 
     def _create_empty_results(self, library: Library, query: SearchQuery, start_time: float) -> SearchResults:
-        execution_time = time.time() - start_time
+        execution_time = self.clock() - start_time
 
         return SearchResults(
             results=[],
@@ -1,5 +1,6 @@
 """Base storage interface for vector embeddings."""
 
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List
@@ -83,3 +84,21 @@ class VectorStorage(ABC):
             List of file IDs that have stored embeddings
         """
         pass
+
+    def _list_file_ids(self, suffix: str) -> List[str]:
+        """List file IDs of stored files whose names end with the given suffix.
+
+        Args:
+            suffix: Filename suffix that follows the file ID, e.g. "_embeddings.json"
+
+        Returns:
+            Sorted list of file IDs
+        """
+        with os.scandir(self.storage_path) as entries:
+            file_ids = [
+                entry.name[: -len(suffix)]
+                for entry in entries
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+            ]
+
+        return sorted(file_ids)
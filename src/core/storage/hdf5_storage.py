@@ -6,9 +6,13 @@ from typing import Any, Dict, List, cast
 
 import h5py
 import numpy as np
+import numpy.typing as npt
 
 from .base import VectorStorage
 
+# Target size of one embeddings chunk; whole-row chunks of about 1MB keep full reads to a few chunk fetches
+_CHUNK_BYTES = 1024 * 1024
+
 
 class HDF5VectorStorage(VectorStorage):
     """HDF5-based storage for vector embeddings.
@@ -18,8 +22,26 @@ class HDF5VectorStorage(VectorStorage):
     - Compression support
     - Fast random access
     - Cross-platform compatibility
+
+    Embeddings are stored as float32 by default. Passing ``embedding_dtype=np.float16``
+    halves the on-disk size at roughly 1e-3 precision; reads still return float32.
     """
 
+    def __init__(self, storage_path: Path, embedding_dtype: npt.DTypeLike = np.float32):
+        """Initialize storage with a base path and on-disk embedding precision.
+
+        Args:
+            storage_path: Base directory for storing vectors
+            embedding_dtype: Floating point dtype of the stored embeddings dataset
+
+        Raises:
+            ValueError: If embedding_dtype is not a floating point type
+        """
+        super().__init__(storage_path)
+        self.embedding_dtype = np.dtype(embedding_dtype)
+        if not np.issubdtype(self.embedding_dtype, np.floating):
+            raise ValueError(f"Embedding dtype must be a floating point type, got {self.embedding_dtype}")
+
     def save_embeddings(
         self,
         file_id: str,
@@ -34,14 +56,19 @@ class HDF5VectorStorage(VectorStorage):
         token_counts = [item["token_count"] for item in embeddings_data]
         embedding_models = [item.get("embedding_model", "unknown") for item in embeddings_data]
 
-        embeddings_array = np.array(embeddings, dtype=np.float32)
+        embeddings_array = np.array(embeddings, dtype=self.embedding_dtype)
+
+        chunks = None
+        if embeddings_array.ndim == 2 and embeddings_array.size:
+            rows, dimension = embeddings_array.shape
+            chunks = (min(rows, max(1, _CHUNK_BYTES // (dimension * embeddings_array.itemsize))), dimension)
 
         with h5py.File(file_path, "w") as f:
             f.create_dataset(
                 "embeddings",
                 data=embeddings_array,
-                compression="gzip",
-                compression_opts=9,
+                chunks=chunks,
+                compression="lzf",
                 shuffle=True,
                 fletcher32=True,  # Checksum for data integrity
             )
@@ -76,31 +103,26 @@ class HDF5VectorStorage(VectorStorage):
         if not file_path.exists():
             raise FileNotFoundError(f"Embeddings file not found: {file_path}")
 
-        embeddings_data = []
-
         with h5py.File(file_path, "r") as f:
-            embeddings = f["embeddings"][:]
-            texts = f["texts"][:]
-            filenames = f["filenames"][:]
-            token_counts = f["token_counts"][:]
-            embedding_models = f["embedding_models"][:]
-
-            for i in range(len(embeddings)):
-                embeddings_data.append(
-                    {
-                        "filename": (
-                            filenames[i].decode("utf-8") if isinstance(filenames[i], bytes) else str(filenames[i])
-                        ),
-                        "text": (texts[i].decode("utf-8") if isinstance(texts[i], bytes) else str(texts[i])),
-                        "token_count": int(token_counts[i]),
-                        "embedding": embeddings[i].tolist(),  # Convert numpy array back to list
-                        "embedding_model": (
-                            embedding_models[i].decode("utf-8")
-                            if isinstance(embedding_models[i], bytes)
-                            else str(embedding_models[i])
-                        ),
-                    }
-                )
+            # Columns are read whole; asstr() decodes each string dataset in one pass
+            embeddings = f["embeddings"][:].tolist()
+            texts = f["texts"].asstr()[:]
+            filenames = f["filenames"].asstr()[:]
+            token_counts = f["token_counts"][:].tolist()
+            embedding_models = f["embedding_models"].asstr()[:]
+
+        embeddings_data = [
+            {
+                "filename": filename,
+                "text": text,
+                "token_count": token_count,
+                "embedding": embedding,
+                "embedding_model": embedding_model,
+            }
+            for filename, text, token_count, embedding, embedding_model in zip(
+                filenames, texts, token_counts, embeddings, embedding_models
+            )
+        ]
 
         return embeddings_data
 
@@ -113,20 +135,15 @@ class HDF5VectorStorage(VectorStorage):
         """Delete embeddings for a given file ID."""
         file_path = self.storage_path / f"{file_id}_embeddings.h5"
 
-        if file_path.exists():
+        try:
             file_path.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
 
     def list_files(self) -> List[str]:
         """List all stored file IDs."""
-        file_ids = []
-        for file_path in self.storage_path.glob("*_embeddings.h5"):
-            # Extract file_id from filename (remove _embeddings.h5 suffix)
-            file_id = file_path.stem.replace("_embeddings", "")
-            file_ids.append(file_id)
-
-        return sorted(file_ids)
+        return self._list_file_ids("_embeddings.h5")
 
     def get_metadata(self, file_id: str) -> Dict[str, Any]:
         """Get metadata for a specific file."""
@@ -145,7 +162,7 @@ class HDF5VectorStorage(VectorStorage):
             return cast(Dict[str, Any], metadata)
 
     def get_embeddings_array(self, file_id: str) -> np.ndarray:
-        """Get embeddings as a numpy array for efficient computation."""
+        """Get embeddings as a float32 numpy array for efficient computation."""
         file_path = self.storage_path / f"{file_id}_embeddings.h5"
 
         if not file_path.exists():
@@ -153,7 +170,11 @@ class HDF5VectorStorage(VectorStorage):
 
         with h5py.File(file_path, "r") as f:
             embeddings_dataset = f["embeddings"]
-            return np.array(embeddings_dataset[:])
+            # HDF5 converts reduced-precision datasets to float32 during the read
+            embeddings = np.empty(embeddings_dataset.shape, dtype=np.float32)
+            if embeddings.size:
+                embeddings_dataset.read_direct(embeddings)
+            return embeddings
 
     def get_file_info(self, file_id: str) -> Dict[str, Any]:
         """Get comprehensive file information including dimensions and compression stats."""
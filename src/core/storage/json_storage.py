@@ -1,11 +1,23 @@
 """JSON storage implementation for vector embeddings."""
 
-import json
+import mmap
 from pathlib import Path
 from typing import Any, Dict, List, cast
 
+import orjson
+
 from .base import VectorStorage
 
+# Numpy embeddings are written as JSON arrays without a tolist() round-trip
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _read_json(file_path: Path) -> Any:
+    """Parse a JSON file straight from a read-only memory map of its pages."""
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            return orjson.loads(view)
+
 
 class JSONVectorStorage(VectorStorage):
     """JSON-based storage for vector embeddings."""
@@ -27,8 +39,7 @@ class JSONVectorStorage(VectorStorage):
 
         file_path = self.storage_path / f"{file_id}_embeddings.json"
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(output_data, f, indent=2)
+        file_path.write_bytes(orjson.dumps(output_data, option=_DUMP_OPTIONS))
 
         return file_path
 
@@ -39,8 +50,7 @@ class JSONVectorStorage(VectorStorage):
         if not file_path.exists():
             raise FileNotFoundError(f"Embeddings file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(file_path)
 
         embeddings = data.get("embeddings", [])
         if not isinstance(embeddings, list):
@@ -56,19 +66,15 @@ class JSONVectorStorage(VectorStorage):
         """Delete embeddings for a given file ID."""
         file_path = self.storage_path / f"{file_id}_embeddings.json"
 
-        if file_path.exists():
+        try:
             file_path.unlink()
-            return True
-        return False
+        except FileNotFoundError:
+            return False
+        return True
 
     def list_files(self) -> List[str]:
         """List all stored file IDs."""
-        file_ids = []
-        for file_path in self.storage_path.glob("*_embeddings.json"):
-            file_id = file_path.stem.replace("_embeddings", "")
-            file_ids.append(file_id)
-
-        return sorted(file_ids)
+        return self._list_file_ids("_embeddings.json")
 
     def get_metadata(self, file_id: str) -> Dict[str, Any]:
         """Get metadata for a specific file."""
@@ -77,8 +83,7 @@ class JSONVectorStorage(VectorStorage):
         if not file_path.exists():
             raise FileNotFoundError(f"Embeddings file not found: {file_path}")
 
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = _read_json(file_path)
 
         metadata = data.get("metadata", {})
         if not isinstance(metadata, dict):
@@ -0,0 +1,47 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+
+import pytest
+
+from src.core.config import settings
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests on uvloop when it is available, falling back to the stock loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
+@pytest.fixture
+def test_tmp(tmp_path_factory, request):
+    """Provide a uniquely numbered per-test directory under the session's temporary base.
+
+    All directories share the single base directory pytest creates for the session.
+    """
+    return tmp_path_factory.mktemp(request.node.name)
+
+
+@pytest.fixture(autouse=True)
+def isolate_orion(monkeypatch, tmp_path):
+    """Point the user data directory at the test's temporary path.
+
+    Every ``settings.get_user_*_path`` helper derives from ``orion_base_dir``, so
+    user directories created by a test land in a fresh tree that pytest cleans up.
+    """
+    monkeypatch.setattr(settings, "orion_base_dir", str(tmp_path))
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Create one API test client for the whole session."""
+    from fastapi.testclient import TestClient
+
+    from src.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
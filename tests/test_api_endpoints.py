@@ -9,21 +9,13 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 from fastapi import UploadFile
-from fastapi.testclient import TestClient
 
 from src.core.domain import LibraryId, Vector
 from src.core.search.query import ChunkSearchResult, SearchAlgorithm, SearchResults
-from src.main import app
 from src.models.query import QueryRequest, QueryResponse
 from src.models.upload import UploadResponse
 
 
-@pytest.fixture
-def client():
-    """Create a test client for the API."""
-    return TestClient(app)
-
-
 @pytest.fixture
 def sample_search_results():
     """Create sample search results for testing."""
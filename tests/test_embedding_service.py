@@ -3,7 +3,7 @@ Tests for the embedding service.
 """
 
 from typing import List
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import DEFAULT, MagicMock, Mock, patch
 
 import pytest
 
@@ -37,11 +37,28 @@ def mock_settings():
     return settings
 
 
+@pytest.fixture
+def patched_embedding_module():
+    """Patch the Cohere SDK and settings of the embedding service module in a single pass."""
+    with patch.multiple("src.core.services.embedding_service", cohere=DEFAULT, settings=DEFAULT) as mocks:
+        yield mocks
+
+
+@pytest.fixture
+def mock_settings_module(patched_embedding_module):
+    """Patched settings object used by the embedding service."""
+    return patched_embedding_module["settings"]
+
+
+@pytest.fixture
+def mock_cohere_class(patched_embedding_module):
+    """Patched Cohere client class used by the embedding service."""
+    return patched_embedding_module["cohere"].Client
+
+
 class TestCohereEmbeddingService:
     """Test the Cohere embedding service."""
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_initialization_with_defaults(self, mock_settings_module, mock_cohere_class):
         """Test initialization with default settings."""
         mock_settings_module.cohere_api_key = "default-key"
@@ -53,8 +70,6 @@ class TestCohereEmbeddingService:
         assert service.model == "default-model"
         mock_cohere_class.assert_called_once_with("default-key")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_initialization_with_custom_params(self, mock_settings_module, mock_cohere_class):
         """Test initialization with custom parameters."""
         service = CohereEmbeddingService(api_key="custom-key", model="custom-model")
@@ -63,8 +78,6 @@ class TestCohereEmbeddingService:
         assert service.model == "custom-model"
         mock_cohere_class.assert_called_once_with("custom-key")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_initialization_missing_api_key(self, mock_settings_module, mock_cohere_class):
         """Test initialization fails when API key is missing."""
         mock_settings_module.cohere_api_key = None
@@ -72,8 +85,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(ValueError, match="Cohere API key is required"):
             CohereEmbeddingService()
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_initialization_empty_api_key(self, mock_settings_module, mock_cohere_class):
         """Test initialization fails when API key is empty."""
         mock_settings_module.cohere_api_key = ""
@@ -81,8 +92,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(ValueError, match="Cohere API key is required"):
             CohereEmbeddingService()
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_success(self, mock_settings_module, mock_cohere_class, mock_cohere_client):
         """Test successful embedding generation."""
@@ -110,8 +119,6 @@ class TestCohereEmbeddingService:
             texts=["test text"], model="embed-english-v3.0", input_type="search_query"
         )
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_empty_text(self, mock_settings_module, mock_cohere_class):
         """Test embedding generation fails with empty text."""
@@ -126,8 +133,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(ValueError, match="Text cannot be empty"):
             await service.generate_embedding("   ")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_api_error(self, mock_settings_module, mock_cohere_class, mock_cohere_client):
         """Test embedding generation handles API errors."""
@@ -143,8 +148,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(RuntimeError, match="Failed to generate embedding: API rate limit exceeded"):
             await service.generate_embedding("test text")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_no_embeddings_returned(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -164,8 +167,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(RuntimeError, match="Failed to generate embedding"):
             await service.generate_embedding("test text")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_invalid_response_format(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -185,8 +186,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(RuntimeError, match="Failed to generate embedding"):
             await service.generate_embedding("test text")
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_get_model_name(self, mock_settings_module, mock_cohere_class):
         """Test getting the model name."""
         mock_settings_module.cohere_api_key = "test-key"
@@ -195,8 +194,6 @@ class TestCohereEmbeddingService:
         service = CohereEmbeddingService()
         assert service.get_model_name() == "embed-english-v3.0"
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_get_embedding_dimension_known_models(self, mock_settings_module, mock_cohere_class):
         """Test getting embedding dimension for known models."""
         mock_settings_module.cohere_api_key = "test-key"
@@ -215,8 +212,6 @@ class TestCohereEmbeddingService:
             service = CohereEmbeddingService()
             assert service.get_embedding_dimension() == expected_dim
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     def test_get_embedding_dimension_unknown_model(self, mock_settings_module, mock_cohere_class):
         """Test getting embedding dimension for unknown model defaults to 1024."""
         mock_settings_module.cohere_api_key = "test-key"
@@ -226,8 +221,6 @@ class TestCohereEmbeddingService:
         service = CohereEmbeddingService()
         assert service.get_embedding_dimension() == 1024  # Default
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_success(self, mock_settings_module, mock_cohere_class, mock_cohere_client):
         """Test successful batch embedding generation."""
@@ -258,8 +251,6 @@ class TestCohereEmbeddingService:
             texts=texts, model="embed-english-v3.0", input_type="search_document"
         )
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_empty_list(self, mock_settings_module, mock_cohere_class):
         """Test batch embedding generation with empty list."""
@@ -271,8 +262,6 @@ class TestCohereEmbeddingService:
         result = await service.generate_embeddings_batch([])
         assert result == []
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_all_empty_texts(self, mock_settings_module, mock_cohere_class):
         """Test batch embedding generation fails when all texts are empty."""
@@ -284,8 +273,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(ValueError, match="All texts are empty"):
             await service.generate_embeddings_batch(["", "   ", ""])
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_filters_empty_texts(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -314,8 +301,6 @@ class TestCohereEmbeddingService:
             texts=["valid text 1", "valid text 2"], model="embed-english-v3.0", input_type="search_document"
         )
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_api_error(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -333,8 +318,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(RuntimeError, match="Failed to generate batch embeddings: Batch processing failed"):
             await service.generate_embeddings_batch(["text 1", "text 2"])
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_invalid_response(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -354,8 +337,6 @@ class TestCohereEmbeddingService:
         with pytest.raises(RuntimeError, match="Failed to generate batch embeddings"):
             await service.generate_embeddings_batch(["text 1", "text 2"])
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embeddings_batch_partial_invalid_embeddings(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -379,8 +360,6 @@ class TestCohereEmbeddingService:
         assert results[0].values == [0.1, 0.2, 0.3]
         assert results[1].values == [0.4, 0.5, 0.6]
 
-    @patch("src.core.services.embedding_service.cohere.Client")
-    @patch("src.core.services.embedding_service.settings")
     @pytest.mark.asyncio
     async def test_generate_embedding_with_custom_model(
         self, mock_settings_module, mock_cohere_class, mock_cohere_client
@@ -33,7 +33,7 @@ class TestEmbeddingsPipeline:
         When: Each test runs
         Then: A unique email address is generated to prevent conflicts
         """
-        return f"pipeline_test_{uuid.uuid4().hex[:8]}@example.com"
+        return f"pipeline_test_{uuid.uuid4().bytes[:4].hex()}@example.com"
 
     @patch("src.core.pipeline_steps.cohere.Client")
     def test_complete_pipeline_with_mock_cohere(self, mock_cohere_class, client, unique_email):
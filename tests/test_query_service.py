@@ -2,24 +2,51 @@
 Tests for query service and library search engine.
 """
 
+import copy
 import time
-from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from datetime import datetime
+from functools import lru_cache
+from unittest.mock import MagicMock, Mock
 
 import pytest
 
 from src.core.domain import Chunk, ChunkId, DocumentId, Library, LibraryId, Vector
-from src.core.search.interfaces import IEmbeddingService, ILibraryRepository
 from src.core.search.query import ChunkSearchResult, SearchAlgorithm, SearchQuery, SearchResults
 from src.core.services.library_search_engine import LibrarySearchEngine
 from src.core.services.query_service import QueryService
 
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
+
+@lru_cache(maxsize=64)
+def _vec(values, model="test-model"):
+    """Return a shared (frozen) Vector for the given tuple of floats."""
+    return Vector.from_list(list(values), model)
+
+
+class AsyncStub:
+    """Lightweight stand-in for AsyncMock: records calls and returns a canned value."""
+
+    __slots__ = ("return_value", "side_effect", "calls")
+
+    def __init__(self, return_value=None, side_effect=None):
+        self.return_value = return_value
+        self.side_effect = side_effect
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.side_effect is not None:
+            raise self.side_effect
+        return self.return_value
+
 
 @pytest.fixture
 def mock_library_repository():
     """Create a mock library repository."""
-    repo = Mock(spec=ILibraryRepository)
-    repo.library_exists = AsyncMock()
-    repo.load_library = AsyncMock()
+    repo = Mock()
+    repo.library_exists = AsyncStub()
+    repo.load_library = AsyncStub()
     return repo
 
 
@@ -27,7 +54,7 @@ def mock_library_repository():
 def mock_search_engine():
     """Create a mock search engine."""
     engine = Mock()
-    engine.search_library = AsyncMock()
+    engine.search_library = AsyncStub()
     engine.get_supported_algorithms = Mock(return_value=["cosine", "hybrid"])
     return engine
 
@@ -35,16 +62,20 @@ def mock_search_engine():
 @pytest.fixture
 def mock_embedding_service():
     """Create a mock embedding service."""
-    service = Mock(spec=IEmbeddingService)
-    service.generate_embedding = AsyncMock()
+    service = Mock()
+    service.generate_embedding = AsyncStub()
     return service
 
 
 @pytest.fixture
-def sample_library():
-    """Create a sample library for testing."""
-    from datetime import datetime
+def query_service(mock_library_repository, mock_search_engine, mock_embedding_service):
+    """Create a query service wired to the mock collaborators."""
+    return QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
+
 
+@pytest.fixture(scope="session")
+def _sample_library_proto():
+    """Build the sample library once per session; consumers must treat it as read-only."""
     from src.core.domain import Document
 
     library = Library(id=LibraryId("test@example.com"), user_email="test@example.com")
@@ -58,21 +89,22 @@ def sample_library():
         uploaded_filename=f"{document_id.value}_test_document.txt",
         content_type="text/plain",
         file_size=1000,
-        upload_timestamp=datetime.now(),
+        upload_timestamp=_FIXED_TS,
     )
 
     # Add some chunks with embeddings to the document
-    for i in range(3):
-        chunk = Chunk(
+    document.add_chunks(
+        Chunk(
             id=ChunkId(document_id.value, i),
             document_id=document_id,
-            filename=f"doc_{document_id.value}_chunk_{i:03d}.txt",
+            filename=f"{document_id.value}_chunk_{i:03d}.txt",
             text=f"Sample chunk {i}",
             token_count=10,
             sequence_index=i,
-            embedding=Vector.from_list([0.1 * i, 0.2 * i, 0.3 * i], "test-model"),
+            embedding=_vec((0.1 * i, 0.2 * i, 0.3 * i)),
         )
-        document.add_chunk(chunk)
+        for i in range(3)
+    )
 
     # Add the document to the library
     library.add_document(document)
@@ -81,29 +113,23 @@ def sample_library():
 
 
 @pytest.fixture
-def sample_search_results(sample_library):
-    """Create sample search results."""
-    chunks = list(sample_library.get_all_chunks())
-    if len(chunks) < 2:
-        # Create additional chunks if needed
-        from datetime import datetime
+def sample_library(request, _sample_library_proto):
+    """Sample library for testing; tests marked ``mutates_library`` get their own deep copy."""
+    if request.node.get_closest_marker("mutates_library"):
+        return copy.deepcopy(_sample_library_proto)
+    return _sample_library_proto
 
-        document_id = DocumentId.generate()
-        document = sample_library.get_all_documents()[0] if sample_library.get_all_documents() else None
-        if document:
-            for i in range(2 - len(chunks)):
-                chunk = Chunk(
-                    id=ChunkId(document.id.value, len(chunks) + i),
-                    document_id=document.id,
-                    filename=f"doc_{document.id.value}_chunk_{len(chunks) + i:03d}.txt",
-                    text=f"Additional chunk {len(chunks) + i}",
-                    token_count=10,
-                    sequence_index=len(chunks) + i,
-                    embedding=Vector.from_list([0.3 + 0.1 * i, 0.4 + 0.1 * i, 0.5 + 0.1 * i], "test-model"),
-                )
-                document.add_chunk(chunk)
-                chunks.append(chunk)
 
+@pytest.fixture(scope="session")
+def _sample_chunks(_sample_library_proto):
+    """The prototype library's chunks, collected once per session."""
+    return tuple(_sample_library_proto.get_all_chunks())
+
+
+@pytest.fixture
+def sample_search_results(sample_library, _sample_chunks):
+    """Create sample search results."""
+    chunks = _sample_chunks
     chunk_results = [
         ChunkSearchResult(chunk=chunks[0], similarity_score=0.9, rank=1),
         ChunkSearchResult(chunk=chunks[1], similarity_score=0.8, rank=2),
@@ -130,13 +156,13 @@ class TestQueryService:
             embedding_service=mock_embedding_service,
         )
 
-        assert service.library_repository == mock_library_repository
-        assert service.search_engine == mock_search_engine
-        assert service.embedding_service == mock_embedding_service
+        assert service.library_repository is mock_library_repository
+        assert service.search_engine is mock_search_engine
+        assert service.embedding_service is mock_embedding_service
 
     @pytest.mark.asyncio
     async def test_execute_query_success(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service, sample_library, sample_search_results
+        self, query_service, mock_library_repository, mock_search_engine, sample_library, sample_search_results
     ):
         """Test successful query execution."""
         # Setup mocks
@@ -144,10 +170,8 @@ class TestQueryService:
         mock_library_repository.load_library.return_value = sample_library
         mock_search_engine.search_library.return_value = sample_search_results
 
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
         # Execute query
-        results = await service.execute_query(
+        results = await query_service.execute_query(
             user_email="test@example.com", query_text="test query", algorithm="cosine", limit=10
         )
 
@@ -155,12 +179,12 @@ class TestQueryService:
         assert results == sample_search_results
 
         # Verify mock calls
-        mock_library_repository.library_exists.assert_called_once_with("test@example.com")
-        mock_library_repository.load_library.assert_called_once_with("test@example.com")
-        mock_search_engine.search_library.assert_called_once()
+        assert mock_library_repository.library_exists.calls == [(("test@example.com",), {})]
+        assert mock_library_repository.load_library.calls == [(("test@example.com",), {})]
+        assert len(mock_search_engine.search_library.calls) == 1
 
         # Check the search query passed to search engine
-        call_args = mock_search_engine.search_library.call_args
+        call_args = mock_search_engine.search_library.calls[0]
         assert call_args[0][0] == sample_library
         search_query = call_args[0][1]
         assert search_query.text == "test query"
@@ -168,111 +192,70 @@ class TestQueryService:
         assert search_query.limit == 10
 
     @pytest.mark.asyncio
-    async def test_execute_query_empty_email(self, mock_library_repository, mock_search_engine, mock_embedding_service):
-        """Test query execution fails with empty email."""
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        with pytest.raises(ValueError, match="User email cannot be empty"):
-            await service.execute_query(user_email="", query_text="test query", algorithm="cosine", limit=10)
-
-        with pytest.raises(ValueError, match="User email cannot be empty"):
-            await service.execute_query(user_email="   ", query_text="test query", algorithm="cosine", limit=10)
-
-    @pytest.mark.asyncio
-    async def test_execute_query_empty_query_text(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service
-    ):
-        """Test query execution fails with empty query text."""
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        with pytest.raises(ValueError, match="Query text cannot be empty"):
-            await service.execute_query(user_email="test@example.com", query_text="", algorithm="cosine", limit=10)
-
-        with pytest.raises(ValueError, match="Query text cannot be empty"):
-            await service.execute_query(user_email="test@example.com", query_text="   ", algorithm="cosine", limit=10)
-
-    @pytest.mark.asyncio
-    async def test_execute_query_invalid_limit(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service
-    ):
-        """Test query execution fails with invalid limit."""
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        with pytest.raises(ValueError, match="Limit must be positive"):
-            await service.execute_query(
-                user_email="test@example.com", query_text="test query", algorithm="cosine", limit=0
-            )
-
-        with pytest.raises(ValueError, match="Limit must be positive"):
-            await service.execute_query(
-                user_email="test@example.com", query_text="test query", algorithm="cosine", limit=-5
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_query_library_not_exists(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service
-    ):
-        """Test query execution fails when library doesn't exist."""
-        mock_library_repository.library_exists.return_value = False
-
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        with pytest.raises(ValueError, match="No library found for user: test@example.com"):
-            await service.execute_query(
-                user_email="test@example.com", query_text="test query", algorithm="cosine", limit=10
-            )
-
-    @pytest.mark.asyncio
-    async def test_execute_query_invalid_algorithm(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service
+    @pytest.mark.parametrize(
+        "user_email, query_text, algorithm, limit, library_exists, message",
+        [
+            ("", "test query", "cosine", 10, True, "User email cannot be empty"),
+            ("   ", "test query", "cosine", 10, True, "User email cannot be empty"),
+            ("test@example.com", "", "cosine", 10, True, "Query text cannot be empty"),
+            ("test@example.com", "   ", "cosine", 10, True, "Query text cannot be empty"),
+            ("test@example.com", "test query", "cosine", 0, True, "Limit must be positive"),
+            ("test@example.com", "test query", "cosine", -5, True, "Limit must be positive"),
+            ("test@example.com", "test query", "cosine", 10, False, "No library found for user: test@example.com"),
+            ("test@example.com", "test query", "invalid_algo", 10, True, "Invalid algorithm"),
+        ],
+    )
+    async def test_execute_query_rejects_invalid_input(
+        self,
+        query_service,
+        mock_library_repository,
+        user_email,
+        query_text,
+        algorithm,
+        limit,
+        library_exists,
+        message,
     ):
-        """Test query execution fails with invalid algorithm."""
-        mock_library_repository.library_exists.return_value = True
-
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
+        """Test query execution fails with invalid input or a missing library."""
+        mock_library_repository.library_exists.return_value = library_exists
 
-        with pytest.raises(ValueError, match="Invalid algorithm"):
-            await service.execute_query(
-                user_email="test@example.com", query_text="test query", algorithm="invalid_algo", limit=10
+        with pytest.raises(ValueError) as exc_info:
+            await query_service.execute_query(
+                user_email=user_email, query_text=query_text, algorithm=algorithm, limit=limit
             )
+        assert message in str(exc_info.value)
 
-    def test_get_supported_algorithms(self, mock_library_repository, mock_search_engine, mock_embedding_service):
+    def test_get_supported_algorithms(self, query_service, mock_search_engine):
         """Test getting supported algorithms."""
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        algorithms = service.get_supported_algorithms()
+        algorithms = query_service.get_supported_algorithms()
 
         assert algorithms == ["cosine", "hybrid"]
         mock_search_engine.get_supported_algorithms.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_library_stats_library_exists(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service, sample_library
-    ):
+    async def test_get_library_stats_library_exists(self, query_service, mock_library_repository, sample_library):
         """Test getting library stats when library exists."""
         mock_library_repository.library_exists.return_value = True
         mock_library_repository.load_library.return_value = sample_library
 
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        stats = await service.get_library_stats("test@example.com")
+        stats = await query_service.get_library_stats("test@example.com")
 
-        assert stats["exists"] is True
-        assert stats["document_count"] == sample_library.get_document_count()
-        assert stats["chunk_count"] == sample_library.get_total_chunk_count()
-        assert stats["chunks_with_embeddings"] == len(sample_library.get_chunks_with_embeddings())
-        assert stats["total_file_size"] == sample_library.get_total_file_size()
+        # sample_library is one 1000-byte document with three embedded chunks
+        expected = {
+            "exists": True,
+            "document_count": 1,
+            "chunk_count": 3,
+            "chunks_with_embeddings": 3,
+            "total_file_size": 1000,
+        }
+        assert stats == expected
 
     @pytest.mark.asyncio
-    async def test_get_library_stats_library_not_exists(
-        self, mock_library_repository, mock_search_engine, mock_embedding_service
-    ):
+    async def test_get_library_stats_library_not_exists(self, query_service, mock_library_repository):
         """Test getting library stats when library doesn't exist."""
         mock_library_repository.library_exists.return_value = False
 
-        service = QueryService(mock_library_repository, mock_search_engine, mock_embedding_service)
-
-        stats = await service.get_library_stats("test@example.com")
+        stats = await query_service.get_library_stats("test@example.com")
 
         expected = {"exists": False, "document_count": 0, "chunk_count": 0, "chunks_with_embeddings": 0}
         assert stats == expected
@@ -290,7 +273,7 @@ class TestLibrarySearchEngine:
         """Test search engine initialization."""
         engine = LibrarySearchEngine(mock_embedding_service)
 
-        assert engine.embedding_service == mock_embedding_service
+        assert engine.embedding_service is mock_embedding_service
         assert SearchAlgorithm.COSINE in engine.algorithms
         assert SearchAlgorithm.HYBRID in engine.algorithms
 
@@ -298,7 +281,7 @@ class TestLibrarySearchEngine:
     async def test_search_library_with_existing_embedding(self, search_engine, sample_library, mock_embedding_service):
         """Test library search when query already has embedding."""
         # Create search query with embedding
-        query_vector = Vector.from_list([0.5, 0.5, 0.5], "test-model")
+        query_vector = _vec((0.5, 0.5, 0.5))
         query = SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=5, embedding=query_vector)
 
         # Execute search
@@ -306,12 +289,13 @@ class TestLibrarySearchEngine:
 
         # Verify results
         assert isinstance(results, SearchResults)
+        assert results.total_chunks_searched == 3  # every sample_library chunk is embedded
 
         # Verify embedding was NOT generated (already existed)
-        mock_embedding_service.generate_embedding.assert_not_called()
+        assert mock_embedding_service.generate_embedding.calls == []
 
     @pytest.mark.asyncio
-    async def test_search_library_no_documents_with_embeddings(self, search_engine, mock_embedding_service):
+    async def test_search_library_no_documents_with_embeddings(self, mock_embedding_service):
         """Test search with library that has no documents with embeddings."""
         # Create empty library
         empty_library = Library(id=LibraryId("test@example.com"), user_email="test@example.com")
@@ -319,8 +303,8 @@ class TestLibrarySearchEngine:
         query = SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=5)
 
         # Execute search
-        with patch("time.time", side_effect=[1000.0, 1000.1]):
-            results = await search_engine.search_library(empty_library, query)
+        search_engine = LibrarySearchEngine(mock_embedding_service, clock=iter([1000.0, 1000.1]).__next__)
+        results = await search_engine.search_library(empty_library, query)
 
         # Verify empty results
         assert len(results.results) == 0
@@ -331,7 +315,7 @@ class TestLibrarySearchEngine:
     async def test_search_library_hybrid_algorithm(self, search_engine, sample_library, mock_embedding_service):
         """Test library search with hybrid algorithm."""
         # Setup mock embedding
-        query_vector = Vector.from_list([0.5, 0.5, 0.5], "test-model")
+        query_vector = _vec((0.5, 0.5, 0.5))
         mock_embedding_service.generate_embedding.return_value = query_vector
 
         # Create search query for hybrid search
@@ -354,11 +338,9 @@ class TestLibrarySearchEngine:
         assert len(algorithms) == 2
 
     @pytest.mark.asyncio
-    async def test_search_library_no_chunks_with_embeddings(self, search_engine, mock_embedding_service):
+    async def test_search_library_no_chunks_with_embeddings(self, mock_embedding_service):
         """Test search with library that has chunks but no embeddings."""
         # Create library with chunks but no embeddings
-        from datetime import datetime
-
         from src.core.domain import Document
 
         library = Library(id=LibraryId("test@example.com"), user_email="test@example.com")
@@ -371,39 +353,43 @@ class TestLibrarySearchEngine:
             uploaded_filename=f"{document_id.value}_test_no_embedding.txt",
             content_type="text/plain",
             file_size=100,
-            upload_timestamp=datetime.now(),
+            upload_timestamp=_FIXED_TS,
         )
 
-        chunk_without_embedding = Chunk(
-            id=ChunkId(document_id.value, 0),
-            document_id=document_id,
-            filename=f"doc_{document_id.value}_chunk_000.txt",
-            text="Sample chunk without embedding",
-            token_count=5,
-            sequence_index=0,
-            # No embedding
+        document.add_chunks(
+            [
+                Chunk(
+                    id=ChunkId(document_id.value, 0),
+                    document_id=document_id,
+                    filename=f"{document_id.value}_chunk_000.txt",
+                    text="Sample chunk without embedding",
+                    token_count=5,
+                    sequence_index=0,
+                    # No embedding
+                )
+            ]
         )
-        document.add_chunk(chunk_without_embedding)
         library.add_document(document)
+        assert library.get_total_chunk_count() == 1
 
         query = SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=5)
 
         # Execute search
-        with patch("time.time", side_effect=[1000.0, 1000.1]):
-            results = await search_engine.search_library(library, query)
+        search_engine = LibrarySearchEngine(mock_embedding_service, clock=iter([1000.0, 1000.1]).__next__)
+        results = await search_engine.search_library(library, query)
 
         # Should return empty results
         assert len(results.results) == 0
         assert results.total_chunks_searched == 0
 
     @pytest.mark.asyncio
-    async def test_create_empty_results(self, search_engine, sample_library):
+    async def test_create_empty_results(self, mock_embedding_service, sample_library):
         """Test creation of empty search results."""
         query = SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=5)
 
         start_time = 1000.0
-        with patch("time.time", return_value=1000.2):
-            results = search_engine._create_empty_results(sample_library, query, start_time)
+        search_engine = LibrarySearchEngine(mock_embedding_service, clock=lambda: 1000.2)
+        results = search_engine._create_empty_results(sample_library, query, start_time)
 
         assert len(results.results) == 0
         assert results.algorithm_used == SearchAlgorithm.COSINE
@@ -29,7 +29,7 @@ class TestableBaseSearch(BaseSearchAlgorithm):
         return "testable"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_vectors():
     """Create sample vectors for testing."""
     return {
@@ -40,7 +40,7 @@ def sample_vectors():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chunks(sample_vectors):
     """Create sample chunks with embeddings for testing."""
     chunks = []
@@ -63,7 +63,7 @@ def sample_chunks(sample_vectors):
     return chunks
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def chunks_without_embeddings():
     """Create chunks without embeddings for testing validation."""
     chunks = []
@@ -190,6 +190,29 @@ class TestCosineSearchAlgorithm:
         assert results[0].similarity_score > results[1].similarity_score
         assert results[1].similarity_score > results[2].similarity_score
 
+    def test_cosine_search_matches_pairwise_similarity(self, sample_vectors, sample_chunks):
+        """Test batched cosine scores match Vector.cosine_similarity, including a zero vector."""
+        search = CosineSearchAlgorithm()
+        document_id = DocumentId.generate()
+        zero_chunk = Chunk(
+            id=ChunkId(document_id.value, 0),
+            document_id=document_id,
+            filename=f"doc_{document_id.value}_chunk_000.txt",
+            text="Zero vector",
+            token_count=2,
+            sequence_index=0,
+            embedding=Vector.from_list([0.0, 0.0, 0.0], "test-model"),
+        )
+        chunks = sample_chunks + [zero_chunk]
+
+        results = search.search(sample_vectors["query"], chunks, len(chunks))
+
+        assert [result.chunk for result in results] == [chunks[0], chunks[2], chunks[1], zero_chunk]
+        for result in results:
+            expected = result.chunk.embedding.cosine_similarity(sample_vectors["query"])
+            assert result.similarity_score == pytest.approx(expected)
+        assert results[-1].similarity_score == 0.0
+
     def test_cosine_search_with_limit(self, sample_vectors, sample_chunks):
         """Test cosine search respects limit parameter."""
         search = CosineSearchAlgorithm()
@@ -375,6 +398,34 @@ class TestHybridSearchAlgorithm:
         assert scores[0] > scores[1]  # chunk1 should have higher score
         assert all(score >= 0 for score in scores)
 
+    def test_hybrid_search_candidate_multiplier_limits_keyword_pass(self, sample_vectors, sample_chunks):
+        """Test that only the top cosine candidates are keyword-scored when a multiplier is set."""
+        keyword_only = HybridSearchAlgorithm(cosine_weight=0.0, keyword_weight=1.0)
+        pruned = HybridSearchAlgorithm(cosine_weight=0.0, keyword_weight=1.0, candidate_multiplier=1)
+
+        # The keyword pass alone prefers chunk2, which is the least similar by cosine
+        results = keyword_only.search(sample_vectors["query"], sample_chunks, 1, query_text="chunk2")
+        assert [result.chunk for result in results] == [sample_chunks[1]]
+
+        # With one candidate per result, only the best cosine match (chunk1) is considered
+        results = pruned.search(sample_vectors["query"], sample_chunks, 1, query_text="chunk2")
+        assert [result.chunk for result in results] == [sample_chunks[0]]
+
+        with pytest.raises(ValueError, match="Candidate multiplier must be at least 1"):
+            HybridSearchAlgorithm(candidate_multiplier=0)
+
+    def test_hybrid_search_reuses_chunk_keyword_counts(self, sample_vectors, sample_chunks):
+        """Test chunk texts are tokenized once and reused across searches."""
+        search = HybridSearchAlgorithm()
+
+        first = search._calculate_keyword_scores("sample text", sample_chunks)
+        second = search._calculate_keyword_scores("sample chunk2", sample_chunks)
+
+        cache_info = search._keyword_counts.cache_info()
+        assert cache_info.misses == len(sample_chunks)
+        assert cache_info.hits == len(sample_chunks)
+        assert len(first) == len(second) == len(sample_chunks)
+
     def test_hybrid_search_with_different_weights(self, sample_vectors, sample_chunks):
         """Test hybrid search with different weight configurations."""
         # Pure semantic search (cosine_weight=1.0)
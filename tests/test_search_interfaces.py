@@ -12,13 +12,13 @@ from src.core.search.query.search_query import SearchAlgorithm, SearchQuery
 from src.core.search.query.search_result import ChunkSearchResult, SearchResults
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_vector():
     """Create a sample vector for testing."""
     return Vector.from_list([0.1, 0.2, 0.3, 0.4], "test-model")
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_chunk():
     """Create a sample chunk for testing."""
     document_id = DocumentId.generate()
@@ -33,6 +33,18 @@ def sample_chunk():
     )
 
 
+@pytest.fixture(scope="module")
+def single_result(sample_chunk):
+    """Create a one-element result list shared by the SearchResults tests."""
+    return [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
+
+
+@pytest.fixture(scope="module")
+def lib_id():
+    """Create the library id shared by the SearchResults tests."""
+    return LibraryId("test@example.com")
+
+
 class TestSearchAlgorithm:
     """Test the SearchAlgorithm enum."""
 
@@ -90,27 +102,20 @@ class TestSearchQuery:
         assert query.limit == 5
         assert query.embedding is None
 
-    def test_search_query_empty_text(self):
-        """Test that empty text raises ValueError."""
-        with pytest.raises(ValueError, match="Query text cannot be empty"):
-            SearchQuery(text="", algorithm=SearchAlgorithm.COSINE, limit=10)
-
-        with pytest.raises(ValueError, match="Query text cannot be empty"):
-            SearchQuery(text="   ", algorithm=SearchAlgorithm.COSINE, limit=10)
-
-    def test_search_query_invalid_limit(self):
-        """Test that invalid limits raise ValueError."""
-        # Zero limit
-        with pytest.raises(ValueError, match="Limit must be positive"):
-            SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=0)
-
-        # Negative limit
-        with pytest.raises(ValueError, match="Limit must be positive"):
-            SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=-5)
-
-        # Limit too high
-        with pytest.raises(ValueError, match="Limit cannot exceed 1000 results"):
-            SearchQuery(text="test query", algorithm=SearchAlgorithm.COSINE, limit=1001)
+    @pytest.mark.parametrize(
+        "text, limit, match",
+        [
+            ("", 10, "Query text cannot be empty"),
+            ("   ", 10, "Query text cannot be empty"),
+            ("test query", 0, "Limit must be positive"),
+            ("test query", -5, "Limit must be positive"),
+            ("test query", 1001, "Limit cannot exceed 1000 results"),
+        ],
+    )
+    def test_search_query_invalid_arguments(self, text, limit, match):
+        """Test that empty text and out-of-range limits raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            SearchQuery(text=text, algorithm=SearchAlgorithm.COSINE, limit=limit)
 
     def test_search_query_has_embedding(self, sample_vector):
         """Test the has_embedding method."""
@@ -132,16 +137,14 @@ class TestSearchQuery:
         hybrid_query = SearchQuery(text="test query", algorithm=SearchAlgorithm.HYBRID, limit=10)
         assert hybrid_query.get_algorithm_name() == "hybrid"
 
+    @pytest.mark.parametrize("limit", [1, 1000])
+    def test_search_query_limit_bounds(self, limit):
+        """Test that the minimum and maximum limits are accepted."""
+        query = SearchQuery(text="test", algorithm=SearchAlgorithm.COSINE, limit=limit)
+        assert query.limit == limit
+
     def test_search_query_edge_cases(self):
         """Test edge cases for SearchQuery."""
-        # Limit of 1 (minimum valid)
-        query = SearchQuery(text="test", algorithm=SearchAlgorithm.COSINE, limit=1)
-        assert query.limit == 1
-
-        # Limit of 1000 (maximum valid)
-        query = SearchQuery(text="test", algorithm=SearchAlgorithm.COSINE, limit=1000)
-        assert query.limit == 1000
-
         # Text with only valid content after stripping
         query = SearchQuery(text="  test query  ", algorithm=SearchAlgorithm.COSINE, limit=10)
         assert query.text == "  test query  "  # Original text preserved
@@ -171,25 +174,19 @@ class TestChunkSearchResult:
         result = ChunkSearchResult(chunk=sample_chunk, similarity_score=0.5, rank=1)
         assert result.rank == 1
 
-    def test_chunk_search_result_invalid_score(self, sample_chunk):
-        """Test that invalid similarity scores raise ValueError."""
-        # Score too low
-        with pytest.raises(ValueError, match="Similarity score must be between 0.0 and 1.0"):
-            ChunkSearchResult(chunk=sample_chunk, similarity_score=-0.1, rank=1)
-
-        # Score too high
-        with pytest.raises(ValueError, match="Similarity score must be between 0.0 and 1.0"):
-            ChunkSearchResult(chunk=sample_chunk, similarity_score=1.1, rank=1)
-
-    def test_chunk_search_result_invalid_rank(self, sample_chunk):
-        """Test that invalid ranks raise ValueError."""
-        # Zero rank
-        with pytest.raises(ValueError, match="Rank must be positive"):
-            ChunkSearchResult(chunk=sample_chunk, similarity_score=0.5, rank=0)
-
-        # Negative rank
-        with pytest.raises(ValueError, match="Rank must be positive"):
-            ChunkSearchResult(chunk=sample_chunk, similarity_score=0.5, rank=-1)
+    @pytest.mark.parametrize(
+        "similarity_score, rank, match",
+        [
+            (-0.1, 1, "Similarity score must be between 0.0 and 1.0"),
+            (1.1, 1, "Similarity score must be between 0.0 and 1.0"),
+            (0.5, 0, "Rank must be positive"),
+            (0.5, -1, "Rank must be positive"),
+        ],
+    )
+    def test_chunk_search_result_invalid_arguments(self, sample_chunk, similarity_score, rank, match):
+        """Test that out-of-range similarity scores and ranks raise ValueError."""
+        with pytest.raises(ValueError, match=match):
+            ChunkSearchResult(chunk=sample_chunk, similarity_score=similarity_score, rank=rank)
 
     def test_chunk_search_result_get_preview(self, sample_chunk):
         """Test getting content preview."""
@@ -223,21 +220,19 @@ class TestChunkSearchResult:
 class TestSearchResults:
     """Test the SearchResults dataclass."""
 
-    def test_search_results_creation(self, sample_chunk):
+    def test_search_results_creation(self, sample_chunk, lib_id):
         """Test creating search results."""
         chunk_results = [
             ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1),
             ChunkSearchResult(chunk=sample_chunk, similarity_score=0.8, rank=2),
         ]
 
-        library_id = LibraryId("test@example.com")
-
         results = SearchResults(
             results=chunk_results,
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.123,
             total_chunks_searched=100,
-            library_id=library_id,
+            library_id=lib_id,
             query_text="test query",
         )
 
@@ -245,20 +240,18 @@ class TestSearchResults:
         assert results.algorithm_used == SearchAlgorithm.COSINE
         assert results.execution_time == 0.123
         assert results.total_chunks_searched == 100
-        assert results.library_id == library_id
+        assert results.library_id == lib_id
         assert results.query_text == "test query"
 
-    def test_search_results_validation(self, sample_chunk):
+    def test_search_results_validation(self, single_result, lib_id):
         """Test search results validation."""
-        chunk_results = [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
-
         # Valid execution time
         results = SearchResults(
-            results=chunk_results,
+            results=single_result,
             algorithm_used=SearchAlgorithm.HYBRID,
             execution_time=0.0,
             total_chunks_searched=1,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
         assert results.execution_time == 0.0
@@ -269,66 +262,60 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.5,
             total_chunks_searched=0,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
         assert results.total_chunks_searched == 0
 
-    def test_search_results_invalid_execution_time(self, sample_chunk):
+    def test_search_results_invalid_execution_time(self, single_result, lib_id):
         """Test that invalid execution time raises ValueError."""
-        chunk_results = [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
-
         with pytest.raises(ValueError, match="Execution time cannot be negative"):
             SearchResults(
-                results=chunk_results,
+                results=single_result,
                 algorithm_used=SearchAlgorithm.COSINE,
                 execution_time=-0.1,
                 total_chunks_searched=1,
-                library_id=LibraryId("test@example.com"),
+                library_id=lib_id,
                 query_text="test",
             )
 
-    def test_search_results_invalid_chunks_searched(self, sample_chunk):
+    def test_search_results_invalid_chunks_searched(self, single_result, lib_id):
         """Test that invalid chunks searched count raises ValueError."""
-        chunk_results = [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
-
         with pytest.raises(ValueError, match="Total chunks searched cannot be negative"):
             SearchResults(
-                results=chunk_results,
+                results=single_result,
                 algorithm_used=SearchAlgorithm.HYBRID,
                 execution_time=0.1,
                 total_chunks_searched=-1,
-                library_id=LibraryId("test@example.com"),
+                library_id=lib_id,
                 query_text="test",
             )
 
-    def test_search_results_empty_query_text(self, sample_chunk):
+    def test_search_results_empty_query_text(self, single_result, lib_id):
         """Test that empty query text is allowed."""
-        chunk_results = [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
-
         # Empty query text should be allowed
         results = SearchResults(
-            results=chunk_results,
+            results=single_result,
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=1,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="",
         )
         assert results.query_text == ""
 
         # Whitespace query text should also be allowed
         results = SearchResults(
-            results=chunk_results,
+            results=single_result,
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=1,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="   ",
         )
         assert results.query_text == "   "
 
-    def test_search_results_get_count(self, sample_chunk):
+    def test_search_results_get_count(self, sample_chunk, lib_id):
         """Test getting result count."""
         chunk_results = [
             ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1),
@@ -341,7 +328,7 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=10,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
@@ -353,23 +340,21 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=10,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
         assert empty_results.get_result_count() == 0
 
-    def test_search_results_has_results(self, sample_chunk):
+    def test_search_results_has_results(self, single_result, lib_id):
         """Test checking if results exist."""
         # With results
-        chunk_results = [ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1)]
-
         results = SearchResults(
-            results=chunk_results,
+            results=single_result,
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=1,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
@@ -381,13 +366,13 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=0,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
         assert empty_results.get_result_count() == 0
 
-    def test_search_results_get_top_result(self, sample_chunk):
+    def test_search_results_get_top_result(self, sample_chunk, lib_id):
         """Test getting the top result."""
         chunk_results = [
             ChunkSearchResult(chunk=sample_chunk, similarity_score=0.9, rank=1),
@@ -399,7 +384,7 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=2,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
@@ -414,7 +399,7 @@ class TestSearchResults:
             algorithm_used=SearchAlgorithm.COSINE,
             execution_time=0.1,
             total_chunks_searched=0,
-            library_id=LibraryId("test@example.com"),
+            library_id=lib_id,
             query_text="test",
         )
 
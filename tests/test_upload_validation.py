@@ -1,17 +1,13 @@
 """Tests for upload endpoint validation."""
 
+import io
 import tempfile
 from pathlib import Path
 
-from fastapi.testclient import TestClient
-
 from src.core.config import settings
-from src.main import app
-
-client = TestClient(app)
 
 
-def test_file_size_validation_small_file():
+def test_file_size_validation_small_file(client):
     """Test that small files are accepted.
 
     Given: A small test file (1KB) within size limits
@@ -20,18 +16,11 @@ def test_file_size_validation_small_file():
     """
     test_content = b"A" * 1024
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        tmp_file.write(test_content)
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response = client.post(
-                "/v1/upload",
-                files={"file": ("test.txt", f, "text/plain")},
-                data={"email": "test@example.com", "description": "Small test file"},
-            )
-
-    Path(tmp_file.name).unlink(missing_ok=True)
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.txt", io.BytesIO(test_content), "text/plain")},
+        data={"email": "test@example.com", "description": "Small test file"},
+    )
 
     assert response.status_code == 201
     data = response.json()
@@ -39,7 +28,7 @@ def test_file_size_validation_small_file():
     assert data["file_size"] == 1024
 
 
-def test_file_size_validation_large_file():
+def test_file_size_validation_large_file(client):
     """Test that files larger than max_file_size are rejected.
 
     Given: A file larger than the configured max size (50MB + 1KB)
@@ -48,25 +37,16 @@ def test_file_size_validation_large_file():
     """
     large_size = settings.max_file_size + 1024  # Just over the limit
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        chunk_size = 1024 * 1024  # 1MB chunks
-        remaining = large_size
-
-        while remaining > 0:
-            chunk = b"A" * min(chunk_size, remaining)
-            tmp_file.write(chunk)
-            remaining -= len(chunk)
-
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response = client.post(
-                "/v1/upload",
-                files={"file": ("large_test.txt", f, "text/plain")},
-                data={"email": "large@example.com", "description": "Large test file"},
-            )
+    with tempfile.NamedTemporaryFile(suffix=".txt") as tmp_file:
+        # Only the size matters here, so extend the file sparsely instead of writing 50MB
+        tmp_file.truncate(large_size)
+        tmp_file.seek(0)
 
-    Path(tmp_file.name).unlink(missing_ok=True)
+        response = client.post(
+            "/v1/upload",
+            files={"file": ("large_test.txt", tmp_file, "text/plain")},
+            data={"email": "large@example.com", "description": "Large test file"},
+        )
 
     assert response.status_code == 413
     data = response.json()
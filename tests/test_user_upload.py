@@ -1,42 +1,37 @@
 """Tests for user-based upload functionality."""
 
-import tempfile
-import uuid
-from pathlib import Path
-
-from fastapi.testclient import TestClient
+import io
+import itertools
+import os
 
 from src.core.config import settings
-from src.main import app
 
-client = TestClient(app)
+_email_seq = itertools.count()
+
 
+def _unique_suffix() -> str:
+    """Return a per-process unique suffix for test email addresses."""
+    return f"{os.getpid()}_{next(_email_seq)}"
 
-def test_user_upload_creates_directories():
+
+def test_user_upload_creates_directories(client):
     """Test that uploading creates user directories.
 
     Given: A user uploads a file for the first time
     When: The upload API is called with a valid email and file
     Then: User-specific directories should be created and file saved in raw_uploads
     """
-    test_email = f"upload_test_{uuid.uuid4().hex[:8]}@example.com"
+    test_email = f"upload_test_{_unique_suffix()}@example.com"
     test_content = b"Test file content"
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        tmp_file.write(test_content)
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response = client.post(
-                "/v1/upload",
-                files={"file": ("test.txt", f, "text/plain")},
-                data={
-                    "email": test_email,
-                    "description": "Test file for user directories",
-                },
-            )
-
-    Path(tmp_file.name).unlink(missing_ok=True)
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.txt", io.BytesIO(test_content), "text/plain")},
+        data={
+            "email": test_email,
+            "description": "Test file for user directories",
+        },
+    )
 
     assert response.status_code == 201
     data = response.json()
@@ -59,7 +54,7 @@ def test_user_upload_creates_directories():
     assert uploaded_file.read_bytes() == test_content
 
 
-def test_invalid_email_format():
+def test_invalid_email_format(client):
     """Test that invalid email formats are rejected.
 
     Given: A file upload request with an invalid email format
@@ -68,60 +63,39 @@ def test_invalid_email_format():
     """
     test_content = b"Test content"
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        tmp_file.write(test_content)
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response = client.post(
-                "/v1/upload",
-                files={"file": ("test.txt", f, "text/plain")},
-                data={"email": "invalid-email", "description": "Test file"},
-            )
-
-    Path(tmp_file.name).unlink(missing_ok=True)
+    response = client.post(
+        "/v1/upload",
+        files={"file": ("test.txt", io.BytesIO(test_content), "text/plain")},
+        data={"email": "invalid-email", "description": "Test file"},
+    )
 
     assert response.status_code == 400
     data = response.json()
     assert "Invalid email format" in data["detail"]
 
 
-def test_multiple_users_separate_folders():
+def test_multiple_users_separate_folders(client):
     """Test that different users get separate folders.
 
     Given: Two different users upload files
     When: Both users upload files with their respective email addresses
     Then: Each user should have separate directory structures and files
     """
-    user1_email = f"user1_{uuid.uuid4().hex[:8]}@example.com"
-    user2_email = f"user2_{uuid.uuid4().hex[:8]}@example.com"
+    user1_email = f"user1_{_unique_suffix()}@example.com"
+    user2_email = f"user2_{_unique_suffix()}@example.com"
     test_content = b"Test content"
 
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        tmp_file.write(test_content)
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response1 = client.post(
-                "/v1/upload",
-                files={"file": ("user1_file.txt", f, "text/plain")},
-                data={"email": user1_email},
-            )
+    response1 = client.post(
+        "/v1/upload",
+        files={"file": ("user1_file.txt", io.BytesIO(test_content), "text/plain")},
+        data={"email": user1_email},
+    )
 
-    Path(tmp_file.name).unlink(missing_ok=True)
-
-    with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as tmp_file:
-        tmp_file.write(test_content)
-        tmp_file.flush()
-
-        with open(tmp_file.name, "rb") as f:
-            response2 = client.post(
-                "/v1/upload",
-                files={"file": ("user2_file.txt", f, "text/plain")},
-                data={"email": user2_email},
-            )
-
-    Path(tmp_file.name).unlink(missing_ok=True)
+    response2 = client.post(
+        "/v1/upload",
+        files={"file": ("user2_file.txt", io.BytesIO(test_content), "text/plain")},
+        data={"email": user2_email},
+    )
 
     assert response1.status_code == 201
     assert response2.status_code == 201
@@ -148,23 +122,17 @@ def test_configuration_user_paths():
     Then: All paths should be correctly formatted and directories should be created
     """
     test_email = "config@test.com"
-
-    user_base = settings.get_user_base_path(test_email)
-    raw_uploads = settings.get_user_raw_uploads_path(test_email)
-    processed_text = settings.get_user_processed_text_path(test_email)
-    raw_chunks = settings.get_user_raw_chunks_path(test_email)
-    processed_vectors = settings.get_user_processed_vectors_path(test_email)
-
-    assert str(user_base).endswith(test_email)
-    assert str(raw_uploads).endswith(f"{test_email}/raw_uploads")
-    assert str(processed_text).endswith(f"{test_email}/processed_text")
-    assert str(raw_chunks).endswith(f"{test_email}/raw_chunks")
-    assert str(processed_vectors).endswith(f"{test_email}/processed_vectors")
+    path_getters = [
+        (settings.get_user_base_path, ""),
+        (settings.get_user_raw_uploads_path, "/raw_uploads"),
+        (settings.get_user_processed_text_path, "/processed_text"),
+        (settings.get_user_raw_chunks_path, "/raw_chunks"),
+        (settings.get_user_processed_vectors_path, "/processed_vectors"),
+    ]
 
     settings.create_user_directories(test_email)
 
-    assert user_base.exists()
-    assert raw_uploads.exists()
-    assert processed_text.exists()
-    assert raw_chunks.exists()
-    assert processed_vectors.exists()
+    for getter, suffix in path_getters:
+        path = getter(test_email)
+        assert str(path).endswith(f"{test_email}{suffix}")
+        assert path.exists()
@@ -1,11 +1,10 @@
 """Tests for vector storage implementations."""
 
 import json
-import tempfile
 import uuid
-from pathlib import Path
 from typing import Any, Dict
 
+import numpy as np
 import pytest
 
 from src.core.storage import (
@@ -20,17 +19,16 @@ class TestJSONVectorStorage:
     """Test JSON vector storage implementation."""
 
     @pytest.fixture
-    def temp_storage_path(self):
+    def temp_storage_path(self, test_tmp):
         """Create temporary storage path.
 
         Given: A need for isolated test storage
         When: Tests are run
-        Then: A temporary directory is provided and cleaned up
+        Then: A fresh directory under the session's temporary base is provided
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return test_tmp
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_embeddings_data(self):
         """Create sample embeddings data for testing.
 
@@ -76,7 +74,14 @@ class TestJSONVectorStorage:
         loaded_data = storage.load_embeddings(file_id)
 
         assert len(loaded_data) == len(sample_embeddings_data)
-        assert loaded_data == sample_embeddings_data
+        assert [{k: v for k, v in item.items() if k != "embedding"} for item in loaded_data] == [
+            {k: v for k, v in item.items() if k != "embedding"} for item in sample_embeddings_data
+        ]
+        # JSON round-trips floats exactly, so compare the embedding matrices element-wise
+        np.testing.assert_array_equal(
+            np.array([item["embedding"] for item in loaded_data]),
+            np.array([item["embedding"] for item in sample_embeddings_data]),
+        )
 
     def test_json_storage_file_structure(
         self, temp_storage_path, sample_embeddings_data
@@ -102,6 +107,22 @@ class TestJSONVectorStorage:
         assert raw_data["storage_format"] == "json"
         assert raw_data["embedding_count"] == len(sample_embeddings_data)
 
+    def test_json_storage_serializes_numpy_embeddings(self, temp_storage_path, sample_embeddings_data):
+        """Test saving embeddings held as numpy arrays.
+
+        Given: Embeddings data whose vectors are float32 numpy arrays
+        When: Data is saved and then loaded
+        Then: The vectors are stored as plain JSON lists
+        """
+        storage = JSONVectorStorage(temp_storage_path)
+        numpy_data = [
+            {**item, "embedding": np.array(item["embedding"], dtype=np.float32)} for item in sample_embeddings_data
+        ]
+
+        storage.save_embeddings("test_numpy", numpy_data, {})
+
+        assert storage.load_embeddings("test_numpy") == sample_embeddings_data
+
     def test_json_storage_exists_and_delete(
         self, temp_storage_path, sample_embeddings_data
     ):
@@ -176,15 +197,14 @@ class TestStorageFactory:
     """Test the storage factory implementation."""
 
     @pytest.fixture
-    def temp_storage_path(self):
+    def temp_storage_path(self, test_tmp):
         """Create temporary storage path.
 
         Given: A need for isolated test storage
         When: Tests are run
-        Then: A temporary directory is provided and cleaned up
+        Then: A fresh directory under the session's temporary base is provided
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return test_tmp
 
     def test_create_json_storage(self, temp_storage_path):
         """Test creating JSON storage through factory.
@@ -215,17 +235,16 @@ class TestHDF5VectorStorage:
     """Test HDF5 vector storage implementation."""
 
     @pytest.fixture
-    def temp_storage_path(self):
+    def temp_storage_path(self, test_tmp):
         """Create temporary storage path.
 
         Given: A need for isolated test storage
         When: Tests are run
-        Then: A temporary directory is provided and cleaned up
+        Then: A fresh directory under the session's temporary base is provided
         """
-        with tempfile.TemporaryDirectory() as temp_dir:
-            yield Path(temp_dir)
+        return test_tmp
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def sample_embeddings_data(self):
         """Create sample embeddings data for testing.
 
@@ -364,3 +383,35 @@ class TestHDF5VectorStorage:
             [[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8]], dtype=np.float32
         )
         np.testing.assert_array_almost_equal(embeddings_array, expected)
+
+    def test_hdf5_storage_float16_embeddings(self, temp_storage_path, sample_embeddings_data):
+        """Test storing embeddings at half precision.
+
+        Given: HDF5 storage configured with a float16 embedding dtype
+        When: Embeddings are saved and read back
+        Then: The dataset is float16 on disk and reads return float32 values within 1e-3
+        """
+        storage = HDF5VectorStorage(temp_storage_path, embedding_dtype=np.float16)
+        file_id = "test_float16"
+
+        storage.save_embeddings(file_id, sample_embeddings_data, {})
+
+        assert storage.get_file_info(file_id)["dtype"] == "float16"
+
+        embeddings_array = storage.get_embeddings_array(file_id)
+        expected = np.array([item["embedding"] for item in sample_embeddings_data], dtype=np.float32)
+        assert embeddings_array.dtype == np.float32
+        np.testing.assert_allclose(embeddings_array, expected, atol=1e-3)
+
+        loaded_data = storage.load_embeddings(file_id)
+        np.testing.assert_allclose([item["embedding"] for item in loaded_data], expected, atol=1e-3)
+
+    def test_hdf5_storage_rejects_non_float_dtype(self, temp_storage_path):
+        """Test that a non floating point embedding dtype is rejected.
+
+        Given: An integer embedding dtype
+        When: HDF5 storage is created with it
+        Then: A ValueError is raised
+        """
+        with pytest.raises(ValueError, match="floating point"):
+            HDF5VectorStorage(temp_storage_path, embedding_dtype=np.int32)